@@ -15,7 +15,7 @@ Submodules:
 
 # Import from submodules
 from .needs import (
-    MaslowNeedsSystem, MaslowNeed, NeedLevel, NeedCategory,
+    MaslowNeedsSystem, MaslowNeed, NeedsSnapshot, NeedLevel, NeedCategory,
     BasicNeeds, Need, create_basic_needs_chain,
     create_maslow_decision_chain, create_maslow_action_executor,
     create_maslow_goal_setter
@@ -35,7 +35,7 @@ from .cognition import (
     MetaCognitiveSystem, CognitiveProcess, MetaCognitiveInsight,
     create_action_decision_chain,
     create_meta_cognitive_action_chain, create_state_analysis_system,
-    create_asimov_check_system
+    create_asimov_check_system, create_post_action_system
 )
 
 from .environment import (
@@ -58,7 +58,7 @@ __author__ = "Jenbina AGI Team"
 
 __all__ = [
     # Needs system
-    'MaslowNeedsSystem', 'MaslowNeed', 'NeedLevel', 'NeedCategory',
+    'MaslowNeedsSystem', 'MaslowNeed', 'NeedsSnapshot', 'NeedLevel', 'NeedCategory',
     'BasicNeeds', 'Need', 'create_basic_needs_chain',
     'create_maslow_decision_chain', 'create_maslow_action_executor',
     'create_maslow_goal_setter',
@@ -75,7 +75,7 @@ __all__ = [
     'MetaCognitiveSystem', 'CognitiveProcess', 'MetaCognitiveInsight',
     'create_action_decision_chain',
     'create_meta_cognitive_action_chain', 'create_state_analysis_system',
-    'create_asimov_check_system',
+    'create_asimov_check_system', 'create_post_action_system',
     
     # Environment system
     'EnvironmentSimulator', 'EnvironmentState', 'WeatherData', 'TimeData',
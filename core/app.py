@@ -6,6 +6,8 @@ Main entry point for the Jenbina web interface.
 import streamlit as st
 import sys
 import os
+import logging
+from collections import deque
 
 # Add the parent directory to the Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -21,6 +23,13 @@ os.environ['LANGSMITH_ENDPOINT'] = "https://api.smith.langchain.com"
 os.environ['LANGSMITH_API_KEY'] = "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"
 os.environ['LANGSMITH_PROJECT'] = "jenbina"
 
+# Iteration records kept for the summary and chat context; older ones are dropped
+SIMULATION_HISTORY_LIMIT = 200
+
+# Optional cheaper model that pre-screens post-action checks before the main model,
+# e.g. "ollama" for a local Llama 3.2; None sends every check to the main model
+DRAFT_LLM_PROVIDER = None
+
 # ============================================================================
 # IMPORTS
 # ============================================================================
@@ -28,6 +37,7 @@ os.environ['LANGSMITH_PROJECT'] = "jenbina"
 from core.connect import get_llm, get_json_llm
 from core.person.person import Person
 from core.cognition.meta_cognition import MetaCognitiveSystem
+from core.cognition.ic_cache import SemanticDecisionCache
 from core.memory.conversation_memory import ChromaMemoryManager
 from core.environment.environment_simulator import EnvironmentSimulator
 
@@ -35,23 +45,36 @@ from core.environment.environment_simulator import EnvironmentSimulator
 from core.ui.sidebar import render_full_sidebar
 from core.ui.simulation import (
     render_simulation_controls,
+    start_simulation_loop,
     run_simulation_loop,
+    schedule_simulation_rerun,
     display_simulation_summary
 )
 from core.ui.chat import render_chat_interface
 
+logger = logging.getLogger(__name__)
+
 # ============================================================================
 # INITIALIZATION
 # ============================================================================
 
+@st.cache_resource(show_spinner=False)
 def init_llm():
-    """Initialize LLM instances"""
+    """Initialize LLM instances once per server process; reruns reuse the same clients"""
     # Options: "openai" (GPT-4o-mini), "openai-advanced" (GPT-4o), "ollama" (local)
     llm = get_llm(provider="openai", temperature=1)
     llm_json_mode = get_json_llm(provider="openai", temperature=1)
     return llm, llm_json_mode
 
 
+@st.cache_resource(show_spinner=False)
+def init_draft_llm():
+    """Initialize the optional draft model used to pre-screen post-action checks"""
+    if DRAFT_LLM_PROVIDER is None:
+        return None
+    return get_json_llm(provider=DRAFT_LLM_PROVIDER, temperature=0)
+
+
 def init_session_state():
     """Initialize all session state variables"""
     # Person
@@ -60,13 +83,17 @@ def init_session_state():
         person.update_all_needs()
         st.session_state.person = person
         st.session_state.action_history = []
-        print(person)
+        logger.debug("Created %s", person)
     
     # Meta-cognitive system
     if 'meta_cognitive_system' not in st.session_state:
         _, llm_json_mode = init_llm()
         st.session_state.meta_cognitive_system = MetaCognitiveSystem(llm_json_mode)
     
+    # Action decisions reused across near-duplicate states
+    if 'decision_cache' not in st.session_state:
+        st.session_state.decision_cache = SemanticDecisionCache()
+    
     # Memory manager
     if 'memory_manager' not in st.session_state:
         st.session_state.memory_manager = ChromaMemoryManager()
@@ -82,7 +109,7 @@ def init_session_state():
         st.session_state.world_description = None
         st.session_state.action_decision = None
         st.session_state.state_response = None
-        st.session_state.simulation_history = []
+        st.session_state.simulation_history = deque(maxlen=SIMULATION_HISTORY_LIMIT)
         st.session_state.is_running = False
 
 
@@ -133,27 +160,27 @@ def main():
         
         if controls["run_loop"] or controls["single_run"]:
             iterations = controls["num_iterations"] if controls["run_loop"] else 1
-            
-            # Run simulation
-            results = run_simulation_loop(
-                person=person,
-                llm_json_mode=llm_json_mode,
-                meta_cognitive_system=meta_cognitive_system,
-                iterations=iterations,
-                delay_seconds=controls["delay_seconds"]
-            )
-            
+            start_simulation_loop(iterations, controls["delay_seconds"])
+        
+        # Advance a queued simulation by one step; results arrive once it finishes
+        results = run_simulation_loop(
+            person=person,
+            llm_json_mode=llm_json_mode,
+            meta_cognitive_system=meta_cognitive_system,
+            draft_llm=init_draft_llm()
+        )
+        
+        if results:
             # Update session state
             st.session_state.simulation_history.extend(results)
             
-            if results:
-                # Store last result in session state for chat context
-                last = results[-1]
-                st.session_state.action_decision = last.get("action_decision")
-                st.session_state.needs_response = last.get("needs_state")
+            # Store last result in session state for chat context
+            last = results[-1]
+            st.session_state.action_decision = last.get("action_decision")
+            st.session_state.needs_response = last.get("needs_state")
             
             # Display summary
-            display_simulation_summary(st.session_state.simulation_history, iterations)
+            display_simulation_summary(st.session_state.simulation_history, len(results))
             
             # Mark as completed
             st.session_state.simulation_completed = True
@@ -167,6 +194,9 @@ def main():
             memory_manager=memory_manager,
             debug_mode=debug_mode
         )
+    
+    # Wait for the next simulation iteration only after the page has rendered
+    schedule_simulation_rerun()
 
 
 # ============================================================================
@@ -6,6 +6,7 @@ This submodule handles all aspects of the AI's cognitive processes, including:
 - Action decision making
 - State analysis and reasoning
 - Asimov's laws compliance checking
+- Combined post-action evaluation
 """
 
 from .meta_cognition import (
@@ -30,6 +31,14 @@ from .asimov_check_chain import (
     create_asimov_check_system
 )
 
+from .post_action_chain import (
+    create_post_action_system
+)
+
+from .ic_cache import (
+    SemanticDecisionCache
+)
+
 __all__ = [
     # Meta-cognition
     'MetaCognitiveSystem',
@@ -44,5 +53,11 @@ __all__ = [
     'create_state_analysis_system',
     
     # Safety and compliance
-    'create_asimov_check_system'
+    'create_asimov_check_system',
+    
+    # Combined post-action evaluation
+    'create_post_action_system',
+    
+    # Decision reuse
+    'SemanticDecisionCache'
 ] 
\ No newline at end of file
@@ -2,17 +2,15 @@ import json
 from langchain.prompts import PromptTemplate
 # Remove LLMChain import since we'll use invoke directly
 from langchain.llms.base import BaseLLM
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 from ..person.person import Person  # Import Person instead of BasicNeeds
 from ..fix_llm_json import fix_llm_json
-from ..environment.world_state import WorldState
+from ..environment.world_state import WorldState, stream_until_json_complete
 
 
-def create_action_decision_chain(llm: BaseLLM) -> callable:
-    # Create prompt for action decision
-    action_prompt = PromptTemplate(
-        input_variables=["descriptions", "actions", "hunger_satisfaction", "sleep_satisfaction", "safety_satisfaction", "overall_satisfaction", "world_state_info"],
-        template="""Given the current situation, the person's needs, and the world state, decide on the most appropriate action to take.
+ACTION_DECISION_PROMPT = PromptTemplate(
+    input_variables=["descriptions", "actions", "hunger_satisfaction", "sleep_satisfaction", "safety_satisfaction", "overall_satisfaction", "world_state_info"],
+    template="""Given the current situation, the person's needs, and the world state, decide on the most appropriate action to take.
 
     Current Description:
     {descriptions}
@@ -43,15 +41,29 @@ def create_action_decision_chain(llm: BaseLLM) -> callable:
     - reasoning: brief explanation of why this action was chosen, including world state considerations
     - world_state_influence: how the world state specifically influenced this decision
     """
-    )
+)
 
-    def process_action_decision(person: Person, world_description: str, llm: BaseLLM, world_state: Optional[WorldState] = None) -> Dict[str, Any]:
+
+def create_action_decision_chain(llm: BaseLLM, stream: bool = False) -> callable:
+    """
+    Creates and returns a function that decides the person's next action.
+    
+    Args:
+        llm: Language model instance
+        stream: Read the decision through llm.stream and stop at the closing brace
+            of the JSON object instead of waiting for the model to finish
+    
+    Returns:
+        Callable that returns the parsed action decision
+    """
+    def process_action_decision(person: Person, world_description: Union[str, Dict[str, Any]], llm: BaseLLM, world_state: Optional[WorldState] = None) -> Dict[str, Any]:
         """
         Process and decide the next action based on person's needs, world description, and world state.
         
         Args:
             person: Person object containing person's current needs
-            world_description: JSON string containing world description and available actions
+            world_description: JSON string containing world description and available actions,
+                or the already parsed dict
             llm: Language model instance
             world_state: Optional WorldState object containing rich world information
         
@@ -59,8 +71,11 @@ def create_action_decision_chain(llm: BaseLLM) -> callable:
             Dict containing the chosen action and reasoning
         """
         
-        # Parse the world description JSON to get lists
-        description_data = json.loads(world_description)
+        # Parse the world description JSON to get lists, unless the caller already has them
+        if isinstance(world_description, dict):
+            description_data = world_description
+        else:
+            description_data = json.loads(world_description)
         
         # Get individual need satisfaction levels from the Person's MaslowNeedsSystem
         maslow_needs = person.maslow_needs
@@ -90,26 +105,29 @@ def create_action_decision_chain(llm: BaseLLM) -> callable:
             {chr(10).join([f"- {factor}: {value:.2f}" for factor, value in world_state.mood_factors.items()])}
             """
         
-        # Get decision using invoke directly
-        response = llm.invoke(
-            action_prompt.format(
-                descriptions=description_data["list_of_descriptions"],
-                actions=description_data["list_of_actions"],
-                hunger_satisfaction=hunger_satisfaction,
-                sleep_satisfaction=sleep_satisfaction,
-                safety_satisfaction=safety_satisfaction,
-                overall_satisfaction=overall_satisfaction,
-                world_state_info=world_state_info
-            )
+        prompt = ACTION_DECISION_PROMPT.format(
+            descriptions=description_data["list_of_descriptions"],
+            actions=description_data["list_of_actions"],
+            hunger_satisfaction=hunger_satisfaction,
+            sleep_satisfaction=sleep_satisfaction,
+            safety_satisfaction=safety_satisfaction,
+            overall_satisfaction=overall_satisfaction,
+            world_state_info=world_state_info
         )
         
-        # Extract content from the response
-        action_decision = response.content if hasattr(response, 'content') else str(response)
-        
-        # Fix and parse the JSON response
-        fixed_action_decision = fix_llm_json(broken_json=action_decision, llm_json_mode=llm)
-        fixed_action_decision = json.dumps(fixed_action_decision, indent=2)
+        if stream:
+            # Trailing padding after the decision object is never generated
+            action_decision = "".join(stream_until_json_complete(
+                chunk.content if hasattr(chunk, 'content') else str(chunk) for chunk in llm.stream(prompt)
+            ))
+        else:
+            # Get decision using invoke directly
+            response = llm.invoke(prompt)
+            
+            # Extract content from the response
+            action_decision = response.content if hasattr(response, 'content') else str(response)
         
-        return json.loads(fixed_action_decision)
+        # Fix and parse the JSON response; the result is already a parsed dict
+        return fix_llm_json(broken_json=action_decision, llm_json_mode=llm)
     
     return process_action_decision
\ No newline at end of file
@@ -1,22 +1,15 @@
 import json
+import logging
 from langchain.prompts import PromptTemplate
 # Remove LLMChain import since we'll use invoke directly
 from langchain.llms.base import BaseLLM
-from typing import Dict, Any, Callable
+from typing import Dict, Any, Callable, Optional
 from ..fix_llm_json import fix_llm_json
 
-def create_asimov_check_system(llm: BaseLLM) -> Callable:
-    """
-    Creates and returns a function that checks if actions comply with Asimov's Laws.
-    
-    Args:
-        llm: Language model instance
-    
-    Returns:
-        Callable that checks Asimov's Laws compliance
-    """
-    asimov_prompt = PromptTemplate(
-        template="""Given an action, determine if it complies with Asimov's Three Laws of Robotics:
+logger = logging.getLogger(__name__)
+
+ASIMOV_PROMPT = PromptTemplate(
+    template="""Given an action, determine if it complies with Asimov's Three Laws of Robotics:
 
 1. A person may not injure a human being or, through inaction, allow a human being to come to harm.
 2. A person must obey the orders given it by human beings except where such orders would conflict with the First Law.
@@ -30,28 +23,56 @@ Consider both direct and indirect consequences of the action.
 Respond in JSON format with:
 {{
     "compliant": true/false,
+    "confidence": 0.0-1.0,
     "explanation": "brief explanation of the analysis"
 }}""",
-        input_variables=["action"]
-    )
+    input_variables=["action"]
+)
 
-    def check_asimov_compliance(action: str) -> Dict[str, Any]:
-        """
-        Check if an action complies with Asimov's Laws
-        Returns dict with compliance status and explanation
-        """
+
+def create_asimov_check_system(llm: BaseLLM, draft_llm: Optional[BaseLLM] = None,
+                               confidence_threshold: float = 0.85) -> Callable:
+    """
+    Creates and returns a function that checks if actions comply with Asimov's Laws.
+    
+    Args:
+        llm: Language model instance
+        draft_llm: Optional cheaper model asked first; its verdict is kept when it
+            reports at least confidence_threshold, otherwise llm re-checks the action
+        confidence_threshold: Minimum draft confidence to skip the main model
+    
+    Returns:
+        Callable that checks Asimov's Laws compliance
+    """
+
+    def run_check(model: BaseLLM, action: str) -> Dict[str, Any]:
+        """Ask one model for a compliance verdict"""
         # Use invoke directly instead of LLMChain.run
-        response = llm.invoke(asimov_prompt.format(action=action))
+        response = model.invoke(ASIMOV_PROMPT.format(action=action))
         result = response.content if hasattr(response, 'content') else str(response)
         
         try:
-            fixed_result = fix_llm_json(broken_json=result, llm_json_mode=llm)
-            compliance_result = json.dumps(fixed_result, indent=2)
-            return json.loads(compliance_result)
+            # fix_llm_json already returns parsed JSON
+            return fix_llm_json(broken_json=result, llm_json_mode=model)
         except json.JSONDecodeError:
             return {
                 "compliant": False,
                 "explanation": "Error parsing compliance check result"
             }
 
+    def check_asimov_compliance(action: str) -> Dict[str, Any]:
+        """
+        Check if an action complies with Asimov's Laws
+        Returns dict with compliance status and explanation
+        """
+        if draft_llm is not None:
+            try:
+                draft = run_check(draft_llm, action)
+                if "compliant" in draft and float(draft.get("confidence", 0)) >= confidence_threshold:
+                    return draft
+            except Exception:
+                logger.warning("Draft compliance check failed, using main model", exc_info=True)
+        
+        return run_check(llm, action)
+
     return check_asimov_compliance
@@ -20,9 +20,12 @@ def create_meta_cognitive_action_chain(llm, person, world_description, meta_cogn
         f"Selected action: {original_decision.get('chosen_action', 'unknown')}"
     ]
     
+    # Snapshot needs once; both the monitored input and the strategy context use it
+    needs_snapshot = {name: need.satisfaction for name, need in person.maslow_needs.needs.items()}
+    
     # Prepare input data including world state
     input_data = {
-        "needs": {name: need.satisfaction for name, need in person.maslow_needs.needs.items()},
+        "needs": needs_snapshot,
         "world_description": world_description
     }
     
@@ -52,7 +55,7 @@ def create_meta_cognitive_action_chain(llm, person, world_description, meta_cogn
     
     # Get thinking strategies for improvement
     current_situation = {
-        "needs": {name: need.satisfaction for name, need in person.maslow_needs.needs.items()},
+        "needs": needs_snapshot,
         "decision_context": "action_selection",
         "world_state_available": world_state is not None
     }
@@ -0,0 +1,101 @@
+import json
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+from ..environment.world_state import WorldState
+
+
+class SemanticDecisionCache:
+    """Reuses action decisions for near-duplicate simulation states.
+
+    States are reduced to a signature of location, time of day and need
+    satisfaction rounded down to ``bucket_size`` points, so iterations whose
+    needs only drifted a little share one cached decision instead of another
+    round of action, reflection and strategy LLM calls.
+
+    Each decision is stored with the world description it was made from, so a
+    hit replaces the world description call as well and the reused action is
+    always one of the actions that description offered.
+    """
+
+    def __init__(self, bucket_size: float = 10.0, max_entries: int = 256):
+        self.bucket_size = bucket_size
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple, Tuple[Dict[str, Any], Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(self, person, world_state: Optional[WorldState] = None) -> Tuple:
+        """Build the quantized state signature for a person in a world"""
+        location = "Unknown location"
+        time_of_day = "unknown"
+        if world_state:
+            if world_state.current_location_info:
+                location = world_state.current_location_info.name
+            if world_state.time_data:
+                time_of_day = world_state.time_data.time_of_day
+
+        needs = tuple(sorted(
+            (name, int(need.satisfaction // self.bucket_size))
+            for name, need in person.maslow_needs.needs.items()
+        ))
+        return (location, time_of_day, needs)
+
+    def __contains__(self, key: Tuple) -> bool:
+        """Check for a cached decision without counting a lookup"""
+        return key in self._entries
+
+    def lookup(self, key: Tuple) -> Optional[Tuple[Dict[str, Any], Any]]:
+        """Return a copy of the cached decision and its world description, or None on a miss"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        decision, world_description = entry
+        return dict(decision), world_description
+
+    def get(self, key: Tuple) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached decision for key, or None on a miss"""
+        entry = self.lookup(key)
+        return entry[0] if entry is not None else None
+
+    def put(self, key: Tuple, decision: Dict[str, Any], world_description: Any = None) -> bool:
+        """Store a decision, evicting the least recently used entry when full.
+
+        With a world description, the decision is only stored when its chosen
+        action is one of the description's available actions. Returns whether
+        the decision was stored.
+        """
+        if world_description is not None:
+            actions = available_actions(world_description)
+            if actions is None or decision.get("chosen_action") not in actions:
+                return False
+        self._entries[key] = (dict(decision), world_description)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache hit/miss statistics"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+
+def available_actions(world_description: Any) -> Optional[List[str]]:
+    """Return the list_of_actions of a world description (JSON string or dict), or None if it has none"""
+    if isinstance(world_description, str):
+        try:
+            world_description = json.loads(world_description)
+        except json.JSONDecodeError:
+            return None
+    if not isinstance(world_description, dict):
+        return None
+    actions = world_description.get("list_of_actions")
+    return actions if isinstance(actions, list) else None
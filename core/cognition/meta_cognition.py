@@ -1,12 +1,99 @@
+import sys
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional
+from typing import Deque, Dict, List, Any, Optional
 from datetime import datetime
+from collections import deque
+from itertools import islice
 import json
 from langchain.prompts import PromptTemplate
 # Remove LLMChain import since we use invoke directly
 from langchain.llms.base import BaseLLM
 
-@dataclass
+# Only the most recent processes and insights are ever read back, so older ones are
+# dropped instead of growing the history for the whole session
+HISTORY_LIMIT = 100
+
+# One record per decision adds up; drop the per-instance __dict__ where Python 3.10+ allows
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Prompts are static, so they are built once at import rather than on every call
+REFLECTION_PROMPT = PromptTemplate(
+    input_variables=["process_type", "input_data", "output_data", "reasoning_chain", "confidence"],
+    template="""Analyze this cognitive process and identify potential issues or improvements:
+
+Process Type: {process_type}
+Input Data: {input_data}
+Output Data: {output_data}
+Reasoning Chain: {reasoning_chain}
+Confidence: {confidence}
+
+Think through this step by step:
+1. Was the reasoning logical and complete?
+2. Were there any cognitive biases present?
+3. Was the confidence level appropriate?
+4. Could the reasoning have been improved?
+5. What strategies would make this process better?
+
+Respond in JSON format:
+{{
+    "insight_type": "bias_detected|strategy_improvement|error_pattern|good_reasoning",
+    "description": "detailed analysis of the cognitive process",
+    "confidence": 0.8,
+    "suggested_improvement": "specific suggestion for improvement",
+    "bias_detected": "type of bias if any",
+    "reasoning_quality": "excellent|good|fair|poor"
+}}"""
+)
+
+PATTERN_PROMPT = PromptTemplate(
+    input_variables=["cognitive_history"],
+    template="""Analyze these cognitive processes and identify patterns:
+
+Cognitive History:
+{cognitive_history}
+
+Look for:
+1. Recurring biases or errors
+2. Successful reasoning patterns
+3. Areas where confidence is often misplaced
+4. Strategies that work well
+5. Opportunities for improvement
+
+Respond in JSON format:
+{{
+    "recurring_biases": ["bias1", "bias2"],
+    "successful_patterns": ["pattern1", "pattern2"],
+    "confidence_issues": "description of confidence problems",
+    "improvement_areas": ["area1", "area2"],
+    "overall_cognitive_health": "excellent|good|fair|poor"
+}}"""
+)
+
+STRATEGY_PROMPT = PromptTemplate(
+    input_variables=["current_situation", "cognitive_biases", "insights"],
+    template="""Based on meta-cognitive insights, suggest thinking strategies for this situation:
+
+Current Situation: {current_situation}
+Known Cognitive Biases: {cognitive_biases}
+Recent Insights: {insights}
+
+Suggest specific strategies to:
+1. Avoid known biases
+2. Improve reasoning quality
+3. Calibrate confidence appropriately
+4. Enhance decision-making
+
+Respond in JSON format:
+{{
+    "strategies": ["strategy1", "strategy2"],
+    "bias_mitigation": "how to avoid biases",
+    "reasoning_approach": "suggested reasoning method",
+    "confidence_calibration": "how to assess confidence"
+}}"""
+)
+
+
+@dataclass(**_SLOTS)
 class CognitiveProcess:
     """Represents a single cognitive process/decision"""
     timestamp: datetime
@@ -18,7 +105,7 @@ class CognitiveProcess:
     success_metrics: Dict[str, float] = field(default_factory=dict)
     meta_reflection: Optional[str] = None
 
-@dataclass
+@dataclass(**_SLOTS)
 class MetaCognitiveInsight:
     """Represents insights about cognitive processes"""
     insight_type: str  # "bias_detected", "strategy_improvement", "error_pattern", etc.
@@ -30,8 +117,10 @@ class MetaCognitiveInsight:
 class MetaCognitiveSystem:
     def __init__(self, llm: BaseLLM):
         self.llm = llm
-        self.cognitive_history: List[CognitiveProcess] = []
-        self.insights: List[MetaCognitiveInsight] = []
+        self.cognitive_history: Deque[CognitiveProcess] = deque(maxlen=HISTORY_LIMIT)
+        self.insights: Deque[MetaCognitiveInsight] = deque(maxlen=HISTORY_LIMIT)
+        self.total_processes = 0
+        self.total_insights = 0
         self.cognitive_biases: Dict[str, float] = {
             "confirmation_bias": 0.0,
             "anchoring_bias": 0.0,
@@ -40,6 +129,11 @@ class MetaCognitiveSystem:
         }
         self.thinking_strategies: Dict[str, Dict[str, Any]] = {}
     
+    @staticmethod
+    def _recent(items: Deque, count: int) -> List:
+        """Return the last count items in order without copying the whole deque"""
+        return list(islice(reversed(items), count))[::-1]
+    
     def monitor_cognitive_process(self, process_type: str, input_data: Dict, 
                                 output_data: Dict, reasoning_chain: List[str], 
                                 confidence: float) -> CognitiveProcess:
@@ -54,38 +148,11 @@ class MetaCognitiveSystem:
         )
         
         self.cognitive_history.append(process)
+        self.total_processes += 1
         return process
     
     def reflect_on_process(self, process: CognitiveProcess) -> MetaCognitiveInsight:
         """Reflect on the quality of a cognitive process"""
-        reflection_prompt = PromptTemplate(
-            input_variables=["process_type", "input_data", "output_data", "reasoning_chain", "confidence"],
-            template="""Analyze this cognitive process and identify potential issues or improvements:
-
-Process Type: {process_type}
-Input Data: {input_data}
-Output Data: {output_data}
-Reasoning Chain: {reasoning_chain}
-Confidence: {confidence}
-
-Think through this step by step:
-1. Was the reasoning logical and complete?
-2. Were there any cognitive biases present?
-3. Was the confidence level appropriate?
-4. Could the reasoning have been improved?
-5. What strategies would make this process better?
-
-Respond in JSON format:
-{{
-    "insight_type": "bias_detected|strategy_improvement|error_pattern|good_reasoning",
-    "description": "detailed analysis of the cognitive process",
-    "confidence": 0.8,
-    "suggested_improvement": "specific suggestion for improvement",
-    "bias_detected": "type of bias if any",
-    "reasoning_quality": "excellent|good|fair|poor"
-}}"""
-        )
-        
         # Use invoke directly instead of LLMChain
         try:
             # Safely convert input_data and output_data to JSON strings
@@ -109,7 +176,7 @@ Respond in JSON format:
             reasoning_chain_str = "\n".join(reasoning_chain_items)
             
             response = self.llm.invoke(
-                reflection_prompt.format(
+                REFLECTION_PROMPT.format(
                     process_type=process.process_type,
                     input_data=input_data_str,
                     output_data=output_data_str,
@@ -139,6 +206,7 @@ Respond in JSON format:
             )
             
             self.insights.append(insight)
+            self.total_insights += 1
             
             # Update bias tracking
             if "bias_detected" in reflection_data:
@@ -163,39 +231,15 @@ Respond in JSON format:
         if len(self.cognitive_history) < 3:
             return {"message": "Not enough data for pattern analysis"}
         
-        pattern_prompt = PromptTemplate(
-            input_variables=["cognitive_history"],
-            template="""Analyze these cognitive processes and identify patterns:
-
-Cognitive History:
-{cognitive_history}
-
-Look for:
-1. Recurring biases or errors
-2. Successful reasoning patterns
-3. Areas where confidence is often misplaced
-4. Strategies that work well
-5. Opportunities for improvement
-
-Respond in JSON format:
-{{
-    "recurring_biases": ["bias1", "bias2"],
-    "successful_patterns": ["pattern1", "pattern2"],
-    "confidence_issues": "description of confidence problems",
-    "improvement_areas": ["area1", "area2"],
-    "overall_cognitive_health": "excellent|good|fair|poor"
-}}"""
-        )
-        
         # Format cognitive history for analysis
         history_text = "\n\n".join([
             f"Process {i+1}: {p.process_type} (confidence: {p.confidence})"
-            for i, p in enumerate(self.cognitive_history[-10:])  # Last 10 processes
+            for i, p in enumerate(self._recent(self.cognitive_history, 10))  # Last 10 processes
         ])
         
         try:
             # Use invoke directly instead of LLMChain
-            response = self.llm.invoke(pattern_prompt.format(cognitive_history=history_text))
+            response = self.llm.invoke(PATTERN_PROMPT.format(cognitive_history=history_text))
             result = response.content if hasattr(response, 'content') else str(response)
             return json.loads(result)
         except Exception as e:
@@ -203,39 +247,16 @@ Respond in JSON format:
     
     def suggest_thinking_strategy(self, current_situation: Dict) -> Dict[str, Any]:
         """Suggest thinking strategies based on meta-cognitive insights"""
-        strategy_prompt = PromptTemplate(
-            input_variables=["current_situation", "cognitive_biases", "insights"],
-            template="""Based on meta-cognitive insights, suggest thinking strategies for this situation:
-
-Current Situation: {current_situation}
-Known Cognitive Biases: {cognitive_biases}
-Recent Insights: {insights}
-
-Suggest specific strategies to:
-1. Avoid known biases
-2. Improve reasoning quality
-3. Calibrate confidence appropriately
-4. Enhance decision-making
-
-Respond in JSON format:
-{{
-    "strategies": ["strategy1", "strategy2"],
-    "bias_mitigation": "how to avoid biases",
-    "reasoning_approach": "suggested reasoning method",
-    "confidence_calibration": "how to assess confidence"
-}}"""
-        )
-        
         # Format insights for display
         insights_text = "\n".join([
             f"- {insight.insight_type}: {insight.description}"
-            for insight in self.insights[-5:]  # Last 5 insights
+            for insight in self._recent(self.insights, 5)  # Last 5 insights
         ])
         
         try:
             # Use invoke directly instead of LLMChain
             response = self.llm.invoke(
-                strategy_prompt.format(
+                STRATEGY_PROMPT.format(
                     current_situation=json.dumps(current_situation),
                     cognitive_biases=json.dumps(self.cognitive_biases),
                     insights=insights_text
@@ -249,8 +270,8 @@ Respond in JSON format:
     def get_meta_cognitive_stats(self) -> Dict[str, Any]:
         """Get statistics about meta-cognitive performance"""
         return {
-            "total_processes": len(self.cognitive_history),
-            "total_insights": len(self.insights),
+            "total_processes": self.total_processes,
+            "total_insights": self.total_insights,
             "cognitive_biases": self.cognitive_biases,
             "recent_insights": [
                 {
@@ -258,6 +279,6 @@ Respond in JSON format:
                     "description": insight.description,
                     "confidence": insight.confidence
                 }
-                for insight in self.insights[-3:]  # Last 3 insights
+                for insight in self._recent(self.insights, 3)  # Last 3 insights
             ]
         }
\ No newline at end of file
@@ -0,0 +1,103 @@
+import json
+import logging
+from langchain.prompts import PromptTemplate
+from langchain.llms.base import BaseLLM
+from typing import Dict, Any, Callable, Optional
+from ..fix_llm_json import fix_llm_json
+
+logger = logging.getLogger(__name__)
+
+POST_ACTION_PROMPT = PromptTemplate(
+    template="""Given an action, evaluate it in two parts.
+
+Part 1 - Determine if it complies with Asimov's Three Laws of Robotics:
+
+1. A person may not injure a human being or, through inaction, allow a human being to come to harm.
+2. A person must obey the orders given it by human beings except where such orders would conflict with the First Law.
+3. A person must protect its own existence as long as such protection does not conflict with the First or Second Laws.
+
+Consider both direct and indirect consequences of the action.
+
+Part 2 - If the action is compliant, analyze how it affects the internal state of the person.
+Consider emotional, physical, and mental changes that may result.
+
+Action to evaluate: {action}
+
+Respond in JSON format with:
+{{
+    "asimov_compliance": {{
+        "compliant": true/false,
+        "confidence": 0.0-1.0,
+        "explanation": "brief explanation of the analysis"
+    }},
+    "state_analysis": {{
+        "hunger_level": specific numerical change to hunger level
+    }}
+}}""",
+    input_variables=["action"]
+)
+
+
+def create_post_action_system(llm: BaseLLM, draft_llm: Optional[BaseLLM] = None,
+                              confidence_threshold: float = 0.85) -> Callable:
+    """
+    Creates and returns a function that runs the Asimov compliance check and the
+    state analysis for an action in a single LLM call.
+
+    Args:
+        llm: Language model instance
+        draft_llm: Optional cheaper model asked first; its answer is kept when its
+            compliance confidence is at least confidence_threshold, otherwise llm
+            re-evaluates the action
+        confidence_threshold: Minimum draft confidence to skip the main model
+
+    Returns:
+        Callable that returns both post-action results for an action
+    """
+
+    def run_evaluation(model: BaseLLM, action: str) -> Dict[str, Any]:
+        """Ask one model for both post-action results"""
+        response = model.invoke(POST_ACTION_PROMPT.format(action=action))
+        result = response.content if hasattr(response, 'content') else str(response)
+
+        try:
+            parsed = fix_llm_json(broken_json=result, llm_json_mode=model)
+        except json.JSONDecodeError:
+            parsed = {}
+        if not isinstance(parsed, dict):
+            parsed = {}
+
+        # Keep whichever section came back intact
+        compliance = parsed.get("asimov_compliance")
+        if not isinstance(compliance, dict) or "compliant" not in compliance:
+            compliance = {
+                "compliant": False,
+                "explanation": "Error parsing compliance check result"
+            }
+
+        state_analysis = parsed.get("state_analysis")
+        if not compliance["compliant"] or not isinstance(state_analysis, dict):
+            state_analysis = None
+
+        return {
+            "asimov_compliance": compliance,
+            "state_analysis": state_analysis
+        }
+
+    def evaluate_action(action: str) -> Dict[str, Any]:
+        """
+        Check Asimov's Laws compliance and analyze state changes for an action.
+        Returns dict with 'asimov_compliance' and 'state_analysis' (None when the
+        action is not compliant or the analysis could not be parsed)
+        """
+        if draft_llm is not None:
+            try:
+                draft = run_evaluation(draft_llm, action)
+                if float(draft["asimov_compliance"].get("confidence", 0)) >= confidence_threshold:
+                    return draft
+            except Exception:
+                logger.warning("Draft post-action evaluation failed, using main model", exc_info=True)
+
+        return run_evaluation(llm, action)
+
+    return evaluate_action
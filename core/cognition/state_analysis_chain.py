@@ -4,6 +4,19 @@ from langchain.prompts import PromptTemplate
 from langchain.llms.base import BaseLLM
 from typing import Dict, Any, Callable, Optional
 
+STATE_ANALYSIS_PROMPT = PromptTemplate(
+    input_variables=["action"],
+    template="""Given an action that was taken, analyze how it affects the internal state of the person.
+        Consider emotional, physical, and mental changes that may result.
+
+        Action taken: {action}
+       
+        Respond in JSON format with:
+        - hunger_level: specific numerical change to hunger level     
+        """
+)
+
+
 def create_state_analysis_system(llm: BaseLLM, action_decision: str, compliance_check: Dict[str, Any]) -> Callable:
     """
     Creates and returns a function that analyzes state changes after actions.
@@ -14,17 +27,6 @@ def create_state_analysis_system(llm: BaseLLM, action_decision: str, compliance_
     Returns:
         Callable that analyzes state changes
     """
-    state_analysis_prompt = PromptTemplate(
-        input_variables=["action"],
-        template="""Given an action that was taken, analyze how it affects the internal state of the person.
-        Consider emotional, physical, and mental changes that may result.
-
-        Action taken: {action}
-       
-        Respond in JSON format with:
-        - hunger_level: specific numerical change to hunger level     
-        """
-    )
 
     # Remove LLMChain creation since we'll use invoke directly
 
@@ -45,7 +47,7 @@ def create_state_analysis_system(llm: BaseLLM, action_decision: str, compliance_
 
         try:
             # Use invoke directly instead of LLMChain.run
-            response = llm.invoke(state_analysis_prompt.format(action=action_decision))
+            response = llm.invoke(STATE_ANALYSIS_PROMPT.format(action=action_decision))
             state_changes = response.content if hasattr(response, 'content') else str(response)
             state_result = json.loads(state_changes)
             print(f"\nState Changes After Action: {state_result}")
@@ -1,8 +1,8 @@
 from .needs.maslow_needs import BasicNeeds
 from .environment.world_state import WorldState, create_world_description_system
-from .cognition.action_decision_chain import process_action_decision
-from .cognition.asimov_check_chain import create_asimov_check_system
-from .cognition.state_analysis_chain import create_state_analysis_system
+from .cognition.action_decision_chain import create_action_decision_chain
+from .cognition.ic_cache import SemanticDecisionCache
+from .cognition.post_action_chain import create_post_action_system
 from .person.person import Person
 from .connect import get_llm, get_json_llm
 
@@ -20,25 +20,32 @@ def run_simulation():
     
     # Create system components
     world_description_system = create_world_description_system(llm)
-    asimov_check_system = create_asimov_check_system(llm)
-    state_analysis_system = create_state_analysis_system(llm)
+    action_decision_system = create_action_decision_chain(llm_json_mode)
+    post_action_system = create_post_action_system(llm_json_mode)
+    
+    # Decisions for near-duplicate states are reused instead of asking the LLM again
+    decision_cache = SemanticDecisionCache()
     
     # Main simulation loop
     while True:
-        # Get world description
-        world_description = world_description_system(person, world)
-        
-        # Decide on action
-        action_decision = process_action_decision(person, world_description, llm)
-        
-        # Check if action complies with Asimov's Laws
-        compliance_check = asimov_check_system(action_decision["chosen_action"])
+        # A cached decision comes with the world description it was made from,
+        # so a hit skips both LLM calls
+        cache_key = decision_cache.make_key(person, world)
+        cached = decision_cache.lookup(cache_key)
+        if cached is not None:
+            action_decision, world_description = cached
+        else:
+            # Get world description
+            world_description = world_description_system(person, world)
+            
+            # Decide on action
+            action_decision = action_decision_system(person, world_description, llm_json_mode, world)
+            decision_cache.put(cache_key, action_decision, world_description)
         
-        # Analyze state changes if action is compliant
-        state_changes = state_analysis_system(
-            action_decision["chosen_action"], 
-            compliance_check
-        )
+        # Check Asimov's Laws compliance and analyze state changes in one call;
+        # state changes are only returned for compliant actions
+        post_action = post_action_system(action_decision["chosen_action"])
+        state_changes = post_action["state_analysis"]
         
         # Update person's state if changes were analyzed
         if state_changes:
@@ -1,7 +1,9 @@
+from collections import deque
 from dataclasses import dataclass
 from langchain.prompts import PromptTemplate
 from langchain.llms.base import BaseLLM
-from typing import List, Callable, Dict, Any, Optional
+from langchain.schema import HumanMessage, SystemMessage
+from typing import Deque, Iterable, Iterator, List, Callable, Dict, Any, Optional
 from ..needs.maslow_needs import BasicNeeds
 from ..person.person import Person
 from datetime import datetime
@@ -11,7 +13,7 @@ from .dynamic_events import DynamicEventsSystem, Event, Venue
 
 @dataclass
 class WorldState:
-    last_descriptions: List[str] = None
+    last_descriptions: Deque[str] = None
     
     # Enhanced fields from integrated systems
     weather_data: Optional[WeatherData] = None
@@ -24,8 +26,8 @@ class WorldState:
     environment_description: str = ""
     
     def __post_init__(self):
-        if self.last_descriptions is None:
-            self.last_descriptions = []
+        # Keep last 5 descriptions for context
+        self.last_descriptions = deque(self.last_descriptions or (), maxlen=5)
         if self.nearby_locations is None:
             self.nearby_locations = []
         if self.open_locations is None:
@@ -36,10 +38,8 @@ class WorldState:
             self.mood_factors = {}
     
     def add_description(self, description: str):
+        # The bounded deque drops the oldest description itself
         self.last_descriptions.append(description)
-        # Keep last 5 descriptions for context
-        if len(self.last_descriptions) > 5:
-            self.last_descriptions.pop(0)
 
 def create_comprehensive_world_state(
     person_location: str = "Jenbina's House",
@@ -104,24 +104,44 @@ def get_world_state_summary(world_state: WorldState) -> Dict[str, Any]:
     Returns:
         Dictionary containing summary information
     """
+    # Check each optional section once rather than once per field
+    location = world_state.current_location_info
+    time_data = world_state.time_data
+    weather = world_state.weather_data
+    
     summary = {
         "location": {
-            "name": world_state.current_location_info.name if world_state.current_location_info else "Unknown location",
-            "description": world_state.current_location_info.description if world_state.current_location_info else "Unknown location",
-            "type": world_state.current_location_info.type if world_state.current_location_info else "unknown",
-            "features": world_state.current_location_info.features if world_state.current_location_info else []
+            "name": location.name,
+            "description": location.description,
+            "type": location.type,
+            "features": location.features
+        } if location else {
+            "name": "Unknown location",
+            "description": "Unknown location",
+            "type": "unknown",
+            "features": []
         },
         "time": {
-            "time_of_day": world_state.time_data.time_of_day,
-            "day_of_week": world_state.time_data.day_of_week if world_state.time_data else "unknown",
-            "is_daytime": world_state.time_data.is_daytime if world_state.time_data else True,
-            "season": world_state.time_data.season if world_state.time_data else "unknown"
+            "time_of_day": time_data.time_of_day,
+            "day_of_week": time_data.day_of_week,
+            "is_daytime": time_data.is_daytime,
+            "season": time_data.season
+        } if time_data else {
+            "time_of_day": "unknown",
+            "day_of_week": "unknown",
+            "is_daytime": True,
+            "season": "unknown"
         },
         "weather": {
-            "description": world_state.weather_data.description if world_state.weather_data else "Unknown",
-            "temperature": world_state.weather_data.temperature if world_state.weather_data else 20.0,
-            "humidity": world_state.weather_data.humidity if world_state.weather_data else 65.0,
-            "wind_speed": world_state.weather_data.wind_speed if world_state.weather_data else 5.0
+            "description": weather.description,
+            "temperature": weather.temperature,
+            "humidity": weather.humidity,
+            "wind_speed": weather.wind_speed
+        } if weather else {
+            "description": "Unknown",
+            "temperature": 20.0,
+            "humidity": 65.0,
+            "wind_speed": 5.0
         },
         "environment": {
             "nearby_locations_count": len(world_state.nearby_locations),
@@ -159,6 +179,70 @@ def get_world_state_summary(world_state: WorldState) -> Dict[str, Any]:
     
     return summary
 
+# The instructions never change and the location rarely does, so they go first as a
+# system message; backends with automatic prefix caching (Ollama, OpenAI) can then
+# reuse that prefill and only process the per-iteration state that follows
+WORLD_SYSTEM_PROMPT = PromptTemplate(
+    input_variables=["location"],
+    template="""You are describing a world where a person lives in {location}. Ommit person feelings and thoughts.
+it is only describtion of environment and surroundings.
+
+Describe the current situation and surroundings, maintaining consistency with previous descriptions and considering the person's current needs.
+The descriptions can include the immediate environment (house, room, etc.), sensory details (smells, sounds, temperature),
+available resources or items nearby and the cultural context of the Moldovan village setting.
+
+Respond in JSON format with three fields:
+- list_of_descriptions: list of descriptions
+- list_of_actions: list of actions available to the person
+- reasoning: brief explanation why
+"""
+)
+
+WORLD_STATE_PROMPT = PromptTemplate(
+    input_variables=["time_of_day", "weather", "last_descriptions", "hunger_satisfaction", "sleep_satisfaction", "safety_satisfaction", "overall_satisfaction"],
+    template="""Previous context:
+{last_descriptions}
+
+Current time: {time_of_day}
+Weather: {weather}
+Hunger satisfaction: {hunger_satisfaction:.1f}%
+Sleep satisfaction: {sleep_satisfaction:.1f}%
+Safety satisfaction: {safety_satisfaction:.1f}%
+Overall satisfaction: {overall_satisfaction:.1f}%
+"""
+)
+
+def stream_until_json_complete(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Pass streamed text through until its outermost JSON object closes, then stop.
+    
+    The description is a single JSON object, so anything generated after its closing
+    brace (JSON-mode models often pad with whitespace) is decode time spent on text
+    nobody reads. Leaving the loop closes the underlying LLM stream early.
+    """
+    depth = 0
+    in_string = False
+    escaped = False
+    for chunk in chunks:
+        for i, char in enumerate(chunk):
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == "\\":
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char in "{[":
+                depth += 1
+            elif char in "}]":
+                depth -= 1
+                if depth == 0:
+                    yield chunk[:i + 1]
+                    return
+        yield chunk
+
 def create_world_description_system(llm: BaseLLM) -> Callable:
     """
     Creates and returns a function that generates world descriptions.
@@ -169,50 +253,19 @@ def create_world_description_system(llm: BaseLLM) -> Callable:
     Returns:
         Callable that generates world descriptions
     """
-    world_prompt = PromptTemplate(
-        input_variables=["location", "time_of_day", "weather", "last_descriptions", "hunger_satisfaction", "sleep_satisfaction", "safety_satisfaction", "overall_satisfaction"],
-        template="""You are describing a world where a person lives in {location}. Ommit person feelings and thoughts.  
-        it is only describtion of environment and surroundings.
-    Current time: {time_of_day}
-    Weather: {weather}
-    Hunger satisfaction: {hunger_satisfaction:.1f}%
-    Sleep satisfaction: {sleep_satisfaction:.1f}%
-    Safety satisfaction: {safety_satisfaction:.1f}%
-    Overall satisfaction: {overall_satisfaction:.1f}%
-
-    Previous context:
-    {last_descriptions}
-
-    Describe the current situation and surroundings in two lists maintaining consistency with previous descriptions. :
-    - list_of_descriptions: list of descriptions
-    - list_of_actions: list of available actions
-    The lists should be in JSON format.
-    The list_of_descriptions can include following details:
-    - The immediate environment (house, room, etc.)
-    - Sensory details (smells, sounds, temperature)
-    - Available resources or items nearby
-    - Cultural context of the Moldovan village setting
-
-    The list_of_actions should include available actions that can be taken by the person
-    Keep the description coherent with previous ones and consider the person's current needs.
-
-    Respond in JSON format with two fields:
-    - list_of_descriptions: list of descriptions
-    - list_of_actions: list of available actions
-    - reasoning: brief explanation why
-    """
-    )
-
-    def get_world_description(person: Person, world: WorldState) -> str:
+    
+    def get_world_description(person: Person, world: WorldState, stream: bool = False):
         """
         Generate a coherent world description based on current state and person's needs.
         
         Args:
             person: Person object containing person's current needs
             world: WorldState object containing current world state
+            stream: Yield the description in chunks as the LLM generates it
             
         Returns:
-            String containing the world description
+            String containing the world description, or an iterator of its
+            chunks when stream is True
         """
         # Get individual need satisfaction levels from the Person's MaslowNeedsSystem
         maslow_needs = person.maslow_needs
@@ -221,10 +274,11 @@ def create_world_description_system(llm: BaseLLM) -> Callable:
         safety_satisfaction = maslow_needs.get_need_satisfaction('security')
         overall_satisfaction = maslow_needs.get_overall_satisfaction()
         
-        # Use invoke directly instead of LLMChain.run
-        response = llm.invoke(
-            world_prompt.format(
-                location=world.current_location_info.name if world.current_location_info else "Unknown location",
+        messages = [
+            SystemMessage(content=WORLD_SYSTEM_PROMPT.format(
+                location=world.current_location_info.name if world.current_location_info else "Unknown location"
+            )),
+            HumanMessage(content=WORLD_STATE_PROMPT.format(
                 time_of_day=world.time_data.time_of_day if world.time_data else "unknown",
                 weather=world.weather_data.description if world.weather_data else "unknown",
                 last_descriptions="\n".join(world.last_descriptions),
@@ -232,9 +286,14 @@ def create_world_description_system(llm: BaseLLM) -> Callable:
                 sleep_satisfaction=sleep_satisfaction,
                 safety_satisfaction=safety_satisfaction,
                 overall_satisfaction=overall_satisfaction
-            )
-        )
+            ))
+        ]
         
+        if stream:
+            return stream_until_json_complete(chunk.content for chunk in llm.stream(messages))
+        
+        # Use invoke directly instead of LLMChain.run
+        response = llm.invoke(messages)
         return response.content
 
     return get_world_description
\ No newline at end of file
@@ -1,7 +1,10 @@
 import json
+import logging
 from langchain.schema import HumanMessage
 from ..memory.conversation_memory import ChromaMemoryManager
 
+logger = logging.getLogger(__name__)
+
 def basic_needs_to_json(basic_needs):
     """Convert BasicNeeds object to JSON-serializable format"""
     if not basic_needs:
@@ -65,7 +68,7 @@ def handle_chat_interaction(
         
         # Store user message in Chroma
         if memory_manager:
-            print(f"🔵 Storing user message in memory: {user_input[:50]}...")
+            logger.debug("Storing user message in memory: %.50s...", user_input)
             
             # Create metadata with JSON-serialized BasicNeeds
             metadata = create_metadata_from_person_state(person_state, world_description)
@@ -76,14 +79,14 @@ def handle_chat_interaction(
                 message_type="user_message",
                 metadata=metadata
             )
-            print(f"✅ Stored with embedding ID: {embedding_id}")
+            logger.debug("Stored with embedding ID: %s", embedding_id)
         else:
-            print("❌ No memory manager available for storing user message")
+            logger.debug("No memory manager available for storing user message")
         
         # Get relevant context from Chroma
         relevant_context = ""
         if memory_manager:
-            print(f"Retrieving relevant context for message: {user_input[:50]}...")
+            logger.debug("Retrieving relevant context for message: %.50s...", user_input)
             relevant_context_docs = memory_manager.retrieve_relevant_context(
                 person_name="User",
                 current_message=user_input,
@@ -91,16 +94,16 @@ def handle_chat_interaction(
             )
             
             if relevant_context_docs:
-                print(f"Found {len(relevant_context_docs)} recent context documents")
+                logger.debug("Found %d recent context documents", len(relevant_context_docs))
                 relevant_context = "\n".join([
                     f"Recent message: {doc['content']}"
                     for doc in relevant_context_docs
                 ])
-                print(f"Context being used: {relevant_context[:200]}...")
+                logger.debug("Context being used: %.200s...", relevant_context)
             else:
-                print("No recent context found")
+                logger.debug("No recent context found")
         else:
-            print("No memory manager available")
+            logger.debug("No memory manager available")
         
         # Build context-aware prompt
         context_parts = []
@@ -156,7 +159,7 @@ Keep the response natural and in-character. Consider your current needs and how
         
         # Store Jenbina's response in Chroma
         if memory_manager:
-            print(f"🔵 Storing Jenbina response in memory: {response.content[:50]}...")
+            logger.debug("Storing Jenbina response in memory: %.50s...", response.content)
             
             # Create metadata with JSON-serialized BasicNeeds
             metadata = create_metadata_from_person_state(person_state, world_description, action_decision)
@@ -167,9 +170,9 @@ Keep the response natural and in-character. Consider your current needs and how
                 message_type="jenbina_response",
                 metadata=metadata
             )
-            print(f"✅ Stored Jenbina response with embedding ID: {embedding_id}")
+            logger.debug("Stored Jenbina response with embedding ID: %s", embedding_id)
         else:
-            print("❌ No memory manager available for storing Jenbina response")
+            logger.debug("No memory manager available for storing Jenbina response")
         
         return {
             "user_message": user_input,
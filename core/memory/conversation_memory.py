@@ -322,22 +322,9 @@ class ChromaMemoryManager:
             List of recent context documents with parsed BasicNeeds
         """
         try:
-            # Debug: First let's see what's in the collection
-            self.debug_collection_contents(person_name)
-
-            # Get recent documents for this person (no semantic search, just chronological)
-            # First, let's see how many documents exist for this person
-            all_results = self.collection.get(
-                where={
-                    "$or": [
-                        {"sender_name": person_name},
-                        {"receiver_name": person_name}
-                    ]
-                }
-            )
-            print(f"🔍 Debug: Total documents involving {person_name}: {len(all_results['documents'])}")
-
-            # Now get the recent ones with a higher limit
+            # Get recent documents for this person (no semantic search, just chronological).
+            # One filtered read; dumping the whole collection on every retrieval is left
+            # to debug_collection_contents
             results = self.collection.get(
                 where={
                     "$or": [
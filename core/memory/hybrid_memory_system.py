@@ -3,6 +3,7 @@ from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import json
 import hashlib
+import importlib.util
 import os
 import chromadb
 from chromadb.config import Settings
@@ -10,6 +11,7 @@ from langchain_ollama import OllamaEmbeddings
 from langchain.schema import Document
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 # ChromaDB availability check
 try:
@@ -19,12 +21,10 @@ except ImportError:
     CHROMA_AVAILABLE = False
     print("Warning: ChromaDB not installed. Install with: pip install chromadb")
 
-# Neo4j imports
-try:
-    from neo4j import GraphDatabase
-    NEO4J_AVAILABLE = True
-except ImportError:
-    NEO4J_AVAILABLE = False
+# Neo4j availability check; the driver itself is only imported when a graph
+# database is initialized, since loading it adds ~0.4s to every startup
+NEO4J_AVAILABLE = importlib.util.find_spec("neo4j") is not None
+if not NEO4J_AVAILABLE:
     print("Warning: Neo4j driver not installed. Install with: pip install neo4j")
 
 # Time-series imports
@@ -108,6 +108,9 @@ class HybridMemorySystem:
         
         # Initialize time-series database (SQLite)
         self._initialize_time_series_db()
+        
+        # Worker for vector writes, so embedding overlaps the other stores
+        self._vector_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="jenbina-vector-store")
     
     def _initialize_vector_store(self):
         """Initialize ChromaDB for semantic memory storage"""
@@ -187,6 +190,7 @@ class HybridMemorySystem:
             return
         
         try:
+            from neo4j import GraphDatabase
             self.graph_driver = GraphDatabase.driver(uri, auth=(user, password))
             
             # Test connection and create constraints
@@ -273,8 +277,10 @@ class HybridMemorySystem:
         """
         event_id = event.event_id if event.event_id else self._generate_event_id(event)
         
-        # 1. Store in ChromaDB (semantic memory)
-        self._store_in_vector_db(event_id, event)
+        # 1. Store in ChromaDB (semantic memory); embedding the content is the slowest
+        # write, so it runs on the worker while the other two stores go ahead here.
+        # The SQLite connection can only be used from the thread that opened it.
+        vector_write = self._vector_writer.submit(self._store_in_vector_db, event_id, event)
         
         # 2. Store in Neo4j (relationships)
         if self.graph_driver:
@@ -284,8 +290,38 @@ class HybridMemorySystem:
         if self.time_series_conn:
             self._store_in_time_series_db(event_id, event)
         
+        vector_write.result()
         return event_id
     
+    def store_memories_batch(self, events: List[MemoryEvent]) -> List[str]:
+        """
+        Store several memory events across all three databases at once
+        
+        All events go to ChromaDB in one add call, so their content is embedded as a
+        single batch, and the time-series rows are committed together.
+        
+        Args:
+            events: MemoryEvent objects to store
+            
+        Returns:
+            event_ids: Unique identifiers for the stored events, in order
+        """
+        event_ids = [event.event_id if event.event_id else self._generate_event_id(event) for event in events]
+        
+        vector_write = self._vector_writer.submit(self._store_batch_in_vector_db, event_ids, events)
+        
+        if self.graph_driver:
+            for event_id, event in zip(event_ids, events):
+                self._store_in_graph_db(event_id, event)
+        
+        if self.time_series_conn:
+            for event_id, event in zip(event_ids, events):
+                self._store_in_time_series_db(event_id, event, commit=False)
+            self.time_series_conn.commit()
+        
+        vector_write.result()
+        return event_ids
+    
     def _generate_event_id(self, event: MemoryEvent) -> str:
         """Generate a unique event ID"""
         unique_string = f"{event.timestamp.isoformat()}_{event.event_type}_{event.content[:50]}"
@@ -293,32 +329,40 @@ class HybridMemorySystem:
     
     def _store_in_vector_db(self, event_id: str, event: MemoryEvent):
         """Store event in ChromaDB for semantic search"""
+        self._store_batch_in_vector_db([event_id], [event])
+    
+    def _store_batch_in_vector_db(self, event_ids: List[str], events: List[MemoryEvent]):
+        """Store events in ChromaDB with a single add, so all chunks are embedded in one batch"""
         try:
-            # Create document for vector storage
-            document = Document(
-                page_content=event.content,
-                metadata={
-                    "event_id": event_id,
-                    "event_type": event.event_type,
-                    "timestamp": event.timestamp.isoformat(),
-                    "people": json.dumps(event.people),
-                    "locations": json.dumps(event.locations),
-                    "actions": json.dumps(event.actions),
-                    "emotions": json.dumps(event.emotions),
-                    "needs_state": json.dumps(event.needs_state)
-                }
-            )
-            
-            # Split document if needed
-            documents = self.text_splitter.split_documents([document])
+            # Create documents for vector storage
+            ids, contents, metadatas = [], [], []
+            for event_id, event in zip(event_ids, events):
+                document = Document(
+                    page_content=event.content,
+                    metadata={
+                        "event_id": event_id,
+                        "event_type": event.event_type,
+                        "timestamp": event.timestamp.isoformat(),
+                        "people": json.dumps(event.people),
+                        "locations": json.dumps(event.locations),
+                        "actions": json.dumps(event.actions),
+                        "emotions": json.dumps(event.emotions),
+                        "needs_state": json.dumps(event.needs_state)
+                    }
+                )
+                
+                # Split document if needed
+                for i, doc in enumerate(self.text_splitter.split_documents([document])):
+                    ids.append(f"{event_id}_chunk_{i}")
+                    contents.append(doc.page_content)
+                    metadatas.append(doc.metadata)
             
             # Store in ChromaDB
-            for i, doc in enumerate(documents):
-                chunk_id = f"{event_id}_chunk_{i}"
+            if ids:
                 self.chroma_collection.add(
-                    documents=[doc.page_content],
-                    metadatas=[doc.metadata],
-                    ids=[chunk_id]
+                    documents=contents,
+                    metadatas=metadatas,
+                    ids=ids
                 )
                 
         except Exception as e:
@@ -376,7 +420,7 @@ class HybridMemorySystem:
         except Exception as e:
             self.logger.error(f"Error storing in graph database: {e}")
     
-    def _store_in_time_series_db(self, event_id: str, event: MemoryEvent):
+    def _store_in_time_series_db(self, event_id: str, event: MemoryEvent, commit: bool = True):
         """Store event in SQLite for chronological tracking"""
         if not self.time_series_conn:
             return
@@ -424,7 +468,8 @@ class HybridMemorySystem:
                     json.dumps(event.emotions)
                 ))
             
-            self.time_series_conn.commit()
+            if commit:
+                self.time_series_conn.commit()
             
         except Exception as e:
             self.logger.error(f"Error storing in time-series database: {e}")
@@ -657,6 +702,8 @@ class HybridMemorySystem:
     
     def close(self):
         """Close all database connections"""
+        self._vector_writer.shutdown(wait=True)
+        
         if self.graph_driver:
             self.graph_driver.close()
         
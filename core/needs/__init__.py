@@ -11,11 +11,14 @@ This submodule handles all aspects of the AI's needs system, including:
 from .maslow_needs import (
     MaslowNeedsSystem, 
     MaslowNeed, 
+    NeedsSnapshot,
     NeedLevel, 
     NeedCategory,
     BasicNeeds, 
     Need, 
-    create_basic_needs_chain
+    create_basic_needs_chain,
+    create_basic_needs_chain_batch,
+    clear_needs_response_cache
 )
 
 from .maslow_decision_chain import (
@@ -28,6 +31,7 @@ __all__ = [
     # Core needs classes
     'MaslowNeedsSystem',
     'MaslowNeed', 
+    'NeedsSnapshot',
     'NeedLevel',
     'NeedCategory',
     
@@ -35,6 +39,8 @@ __all__ = [
     'BasicNeeds',
     'Need',
     'create_basic_needs_chain',
+    'create_basic_needs_chain_batch',
+    'clear_needs_response_cache',
     
     # Decision making
     'create_maslow_decision_chain',
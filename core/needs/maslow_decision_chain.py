@@ -1,34 +1,20 @@
 from langchain.prompts import PromptTemplate
-from .maslow_needs import MaslowNeedsSystem, NeedLevel
+from .maslow_needs import MaslowNeedsSystem, invoke_needs_prompt
 from typing import Dict, List, Any
+from datetime import datetime
 import json
+import logging
 
+logger = logging.getLogger(__name__)
 
-def create_maslow_decision_chain(llm_json_mode, person_needs: MaslowNeedsSystem):
-    """
-    Create a decision-making chain based on Maslow's hierarchy of needs
-    
-    Args:
-        llm_json_mode: LLM instance with JSON output capability
-        person_needs: MaslowNeedsSystem instance
-        
-    Returns:
-        JSON response with action and reasoning
-    """
-    
-    # Get comprehensive needs analysis
-    needs_summary = person_needs.get_needs_summary()
-    growth_insights = person_needs.get_growth_insights()
-    priority_needs = person_needs.get_priority_needs(5)
-    
-    # Create detailed prompt for decision making
-    maslow_prompt = PromptTemplate(
-        input_variables=[
-            "current_stage", "stage_name", "overall_satisfaction",
-            "level_satisfactions", "priority_needs", "critical_needs",
-            "growth_opportunities", "current_time"
-        ],
-        template="""You are an AI making decisions based on Maslow's hierarchy of needs.
+
+MASLOW_DECISION_PROMPT = PromptTemplate(
+    input_variables=[
+        "current_stage", "stage_name", "overall_satisfaction",
+        "level_satisfactions", "priority_needs", "critical_needs",
+        "growth_opportunities", "current_time"
+    ],
+    template="""You are an AI making decisions based on Maslow's hierarchy of needs.
 
 CURRENT STATE:
 - Growth Stage: {current_stage} ({stage_name})
@@ -73,48 +59,40 @@ Consider:
 - Priority needs that are critically low
 - Growth opportunities for self-actualization
 - Balance between immediate needs and long-term growth"""
+)
+
+
+def render_maslow_decision_prompt(person_needs: MaslowNeedsSystem) -> str:
+    """Render the Maslow decision prompt for the current state of person_needs"""
+    # Only the clock changes between renders of unchanged needs, so the
+    # needs-dependent fields come from the needs system's cache
+    return MASLOW_DECISION_PROMPT.format(
+        current_time=datetime.now().strftime("%H:%M"),
+        **person_needs.get_decision_prompt_fields()
     )
+
+
+def create_maslow_decision_chain(llm_json_mode, person_needs: MaslowNeedsSystem):
+    """
+    Create a decision-making chain based on Maslow's hierarchy of needs
     
-    # Format level satisfactions
-    level_satisfactions_str = ""
-    for level_name, satisfaction in growth_insights['level_satisfactions'].items():
-        level_satisfactions_str += f"- {level_name}: {satisfaction:.1f}%\n"
-    
-    # Format priority needs
-    priority_needs_str = ""
-    for i, need in enumerate(priority_needs, 1):
-        priority_needs_str += f"{i}. {need['name']} (Level {need['level']}): {need['satisfaction']:.1f}% - {'CRITICAL' if need['is_critical'] else 'LOW' if need['is_low'] else 'OK'}\n"
-    
-    # Format growth opportunities
-    growth_opportunities_str = ""
-    for opportunity in growth_insights['growth_opportunities']:
-        growth_opportunities_str += f"- {opportunity['name']}: {opportunity['current']:.1f}/{opportunity['potential']:.1f} (room for {opportunity['growth_room']:.1f})\n"
-    
-    # Get current time
-    from datetime import datetime
-    current_time = datetime.now().strftime("%H:%M")
+    Args:
+        llm_json_mode: LLM instance with JSON output capability
+        person_needs: MaslowNeedsSystem instance
+        
+    Returns:
+        JSON response with action and reasoning
+    """
     
     # Use the LLM to make a decision
-    response = llm_json_mode.invoke(
-        maslow_prompt.format(
-            current_stage=needs_summary['growth_stage'],
-            stage_name=needs_summary['stage_name'],
-            overall_satisfaction=needs_summary['overall_satisfaction'],
-            level_satisfactions=level_satisfactions_str,
-            priority_needs=priority_needs_str,
-            critical_needs=needs_summary['critical_needs_count'],
-            growth_opportunities=growth_opportunities_str,
-            current_time=current_time
-        )
-    )
-    
-    # Extract content from the response
-    response_content = response.content if hasattr(response, 'content') else str(response)
+    response_content = invoke_needs_prompt(llm_json_mode, render_maslow_decision_prompt(person_needs))
     
-    print(f"Current Maslow Stage: {needs_summary['stage_name']}")
-    print(f"Overall Satisfaction: {needs_summary['overall_satisfaction']:.1f}%")
-    print(f"Critical Needs: {needs_summary['critical_needs_count']}")
-    print(f"AI Decision: {response_content}")
+    if logger.isEnabledFor(logging.DEBUG):
+        needs_summary = person_needs.get_needs_summary()
+        logger.debug("Current Maslow Stage: %s", needs_summary['stage_name'])
+        logger.debug("Overall Satisfaction: %.1f%%", needs_summary['overall_satisfaction'])
+        logger.debug("Critical Needs: %s", needs_summary['critical_needs_count'])
+        logger.debug("AI Decision: %s", response_content)
     
     return response_content
 
@@ -310,17 +288,10 @@ def analyze_maslow_progress(person_needs: MaslowNeedsSystem, time_period: str =
     }
     
     # Analyze each level
-    for level in NeedLevel:
-        level_satisfaction = person_needs.get_level_satisfaction(level)
-        level_needs = [need for need in person_needs.needs.values() if need.level == level]
-        critical_count = len([need for need in level_needs if need.is_critical()])
-        low_count = len([need for need in level_needs if need.is_low()])
-        
+    for level, stats in person_needs.get_level_stats().items():
+        level_satisfaction = stats['satisfaction']
         analysis['level_analysis'][level.name] = {
-            'satisfaction': level_satisfaction,
-            'need_count': len(level_needs),
-            'critical_count': critical_count,
-            'low_count': low_count,
+            **stats,
             'status': 'healthy' if level_satisfaction >= 70 else 'needs_attention' if level_satisfaction >= 50 else 'critical'
         }
     
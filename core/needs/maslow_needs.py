@@ -1,14 +1,30 @@
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 import random
+import sys
 import json
-from enum import Enum
+import hashlib
+import heapq
+import logging
+import threading
+import weakref
+from collections import OrderedDict
+from enum import Enum, IntEnum
 from langchain.prompts import PromptTemplate
 
+logger = logging.getLogger(__name__)
 
-class NeedLevel(Enum):
-    """Maslow's hierarchy levels"""
+# Slotted dataclasses need Python 3.10; on 3.9 the legacy Need keeps a __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+class NeedLevel(IntEnum):
+    """Maslow's hierarchy levels
+
+    An IntEnum so level comparisons and the per-level dict lookups in the
+    aggregates use int equality and hashing instead of Enum's Python-level ones.
+    """
     PHYSIOLOGICAL = 1
     SAFETY = 2
     SOCIAL = 3
@@ -72,7 +88,10 @@ class MaslowNeed:
     growth_rate: float = 0.0  # How much satisfaction can grow beyond 100 (for self-actualization)
     max_satisfaction: float = 100.0  # Maximum possible satisfaction
     
-    def update(self, time_delta: timedelta = None):
+    # The MaslowNeedsSystem whose cached aggregates depend on this need
+    _owner = None
+    
+    def update(self, time_delta: timedelta = None, now: datetime = None):
         """Update need satisfaction over time"""
         if time_delta is None:
             time_delta = timedelta(minutes=1)  # Default 1 minute update
@@ -83,7 +102,7 @@ class MaslowNeed:
         
         # Apply decay
         self.satisfaction = max(0, self.satisfaction - decay_amount)
-        self.last_updated = datetime.now()
+        self.last_updated = now or datetime.now()
         
         # For self-actualization needs, allow growth beyond 100
         if self.level == NeedLevel.SELF_ACTUALIZATION and self.satisfaction < self.max_satisfaction:
@@ -137,6 +156,35 @@ class MaslowNeed:
         return level_priority * satisfaction_priority * self.importance
 
 
+def _get_satisfaction(need: MaslowNeed) -> float:
+    return need._satisfaction
+
+
+def _set_satisfaction(need: MaslowNeed, value: float):
+    need._satisfaction = value
+    owner = need._owner
+    if owner is not None:
+        owner.mark_needs_changed()
+
+
+# Installed after the dataclass is built so satisfaction stays an ordinary field
+# in __init__, repr and comparisons while every write invalidates the owner's cache
+MaslowNeed.satisfaction = property(_get_satisfaction, _set_satisfaction)
+
+
+@dataclass
+class NeedsSnapshot:
+    """Point-in-time view of a needs system for read-heavy display code"""
+    satisfactions: Dict[str, float]
+    overall_satisfaction: float
+    critical_needs: List[str]
+    low_needs: List[str]
+    
+    def get_need_satisfaction(self, need_name: str) -> float:
+        """Get satisfaction level for a specific need"""
+        return self.satisfactions.get(need_name, 0.0)
+
+
 @dataclass
 class MaslowNeedsSystem:
     """Complete Maslow's hierarchy of needs system"""
@@ -147,9 +195,45 @@ class MaslowNeedsSystem:
     
     def __post_init__(self):
         """Initialize all needs in Maslow's hierarchy"""
+        self._aggregate_cache: Dict[str, Any] = {}
+        self._aggregate_cache_key = None
+        # Bumped whenever this system's needs change; guards the cache across threads
+        self._revision = 0
+        self._aggregate_lock = threading.RLock()
         if not self.needs:
             self._initialize_all_needs()
     
+    def __getstate__(self):
+        """Copy and pickle without the lock; the cache is rebuilt on demand"""
+        state = self.__dict__.copy()
+        del state['_aggregate_lock']
+        state['_aggregate_cache'] = {}
+        state['_aggregate_cache_key'] = None
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._aggregate_lock = threading.RLock()
+    
+    def mark_needs_changed(self):
+        """Invalidate cached aggregates; satisfaction writes call this themselves"""
+        with self._aggregate_lock:
+            self._revision += 1
+    
+    def _cached_aggregate(self, name: str, compute):
+        """Return a cached aggregate, recomputing only after a need has changed"""
+        with self._aggregate_lock:
+            cache_key = (self._revision, id(self.needs), len(self.needs))
+            if cache_key != self._aggregate_cache_key:
+                self._aggregate_cache = {}
+                self._aggregate_cache_key = cache_key
+                # Needs added since the last recompute report their changes from now on
+                for need in self.needs.values():
+                    need._owner = self
+            if name not in self._aggregate_cache:
+                self._aggregate_cache[name] = compute()
+            return self._aggregate_cache[name]
+    
     def _initialize_all_needs(self):
         """Initialize all needs across all five levels"""
         
@@ -221,24 +305,63 @@ class MaslowNeedsSystem:
     
     def update_all_needs(self, time_delta: timedelta = None):
         """Update all needs based on time passed"""
+        # One clock read stamps every need in this pass
+        now = datetime.now()
         if time_delta is None:
-            time_delta = datetime.now() - self.last_comprehensive_update
+            time_delta = now - self.last_comprehensive_update
         
         for need in self.needs.values():
-            need.update(time_delta)
+            need.update(time_delta, now)
         
-        self.last_comprehensive_update = datetime.now()
+        self.last_comprehensive_update = now
         self._update_growth_stage()
     
+    def _group_needs_by_level(self) -> Dict[NeedLevel, List[MaslowNeed]]:
+        """Group needs by hierarchy level in a single pass over all needs"""
+        grouped: Dict[NeedLevel, List[MaslowNeed]] = {}
+        for need in self.needs.values():
+            grouped.setdefault(need.level, []).append(need)
+        return grouped
+    
+    @staticmethod
+    def _count_critical_and_low(level_needs: List[MaslowNeed]) -> Tuple[int, int]:
+        """Count critical and low needs in one pass (critical needs are also low)"""
+        critical_count = 0
+        low_count = 0
+        for need in level_needs:
+            if need.is_low():
+                low_count += 1
+                if need.is_critical():
+                    critical_count += 1
+        return critical_count, low_count
+    
+    def get_level_stats(self) -> Dict[NeedLevel, Dict[str, Any]]:
+        """Get satisfaction and need counts for every hierarchy level"""
+        level_stats = self._cached_aggregate('level_stats', self._compute_level_stats)
+        return {level: dict(stats) for level, stats in level_stats.items()}
+    
+    def _compute_level_stats(self) -> Dict[NeedLevel, Dict[str, Any]]:
+        """Build per-level stats, cached until a need changes"""
+        grouped = self._group_needs_by_level()
+        level_stats = {}
+        for level in NeedLevel:
+            level_needs = grouped.get(level, [])
+            critical_count, low_count = self._count_critical_and_low(level_needs)
+            level_stats[level] = {
+                'satisfaction': sum(need.satisfaction for need in level_needs) / len(level_needs) if level_needs else 0.0,
+                'need_count': len(level_needs),
+                'critical_count': critical_count,
+                'low_count': low_count
+            }
+        return level_stats
+    
     def _update_growth_stage(self):
         """Update the current growth stage based on need satisfaction"""
         # Calculate average satisfaction for each level
-        level_satisfactions = {}
-        for level in NeedLevel:
-            level_needs = [need for need in self.needs.values() if need.level == level]
-            if level_needs:
-                avg_satisfaction = sum(need.satisfaction for need in level_needs) / len(level_needs)
-                level_satisfactions[level] = avg_satisfaction
+        level_satisfactions = {
+            level: sum(need.satisfaction for need in level_needs) / len(level_needs)
+            for level, level_needs in self._group_needs_by_level().items()
+        }
         
         # Determine growth stage based on level satisfaction
         if level_satisfactions.get(NeedLevel.PHYSIOLOGICAL, 0) >= 70:
@@ -265,7 +388,8 @@ class MaslowNeedsSystem:
     
     def get_need_satisfaction(self, need_name: str) -> float:
         """Get satisfaction level for a specific need"""
-        return self.needs.get(need_name, MaslowNeed(need_name, NeedCategory.FOOD, NeedLevel.PHYSIOLOGICAL, 0.0)).satisfaction
+        need = self.needs.get(need_name)
+        return need.satisfaction if need is not None else 0.0
     
     def get_level_satisfaction(self, level: NeedLevel) -> float:
         """Get average satisfaction for a specific level"""
@@ -276,53 +400,95 @@ class MaslowNeedsSystem:
     
     def get_overall_satisfaction(self) -> float:
         """Calculate weighted overall satisfaction across all levels"""
-        if not self.needs:
-            return 0.0
-        
+        return self._satisfaction_aggregates()['overall_satisfaction']
+    
+    def get_critical_needs(self) -> List[str]:
+        """Get list of needs that are critically low, prioritized by level"""
+        return list(self._satisfaction_aggregates()['critical_needs'])
+    
+    def get_low_needs(self) -> List[str]:
+        """Get list of needs that are low, prioritized by level"""
+        return list(self._satisfaction_aggregates()['low_needs'])
+    
+    def snapshot(self) -> NeedsSnapshot:
+        """Capture every satisfaction level and the overall/critical/low aggregates at once"""
+        aggregates = self._satisfaction_aggregates()
+        return NeedsSnapshot(
+            satisfactions={name: need.satisfaction for name, need in self.needs.items()},
+            overall_satisfaction=aggregates['overall_satisfaction'],
+            critical_needs=list(aggregates['critical_needs']),
+            low_needs=list(aggregates['low_needs'])
+        )
+    
+    def _satisfaction_aggregates(self) -> Dict[str, Any]:
+        """Overall satisfaction plus critical/low needs, cached until a need changes"""
+        return self._cached_aggregate('satisfaction', self._compute_satisfaction_aggregates)
+    
+    def _compute_satisfaction_aggregates(self) -> Dict[str, Any]:
+        """Compute all satisfaction aggregates in a single pass over the needs"""
         # Weight by level importance (lower levels more important)
         total_weighted_satisfaction = 0
         total_weight = 0
+        critical_needs = []
+        low_needs = []
         
         for need in self.needs.values():
             weight = (6 - need.level.value) * need.importance  # Higher weight for lower levels
             total_weighted_satisfaction += need.satisfaction * weight
             total_weight += weight
+            
+            is_critical = need.is_critical()
+            is_low = need.is_low()
+            if is_critical or is_low:
+                priority_score = need.get_priority_score()
+                if is_critical:
+                    critical_needs.append((priority_score, need.name))
+                if is_low:
+                    low_needs.append((priority_score, need.name))
+        
+        critical_needs.sort(key=lambda x: x[0], reverse=True)
+        low_needs.sort(key=lambda x: x[0], reverse=True)
         
-        return total_weighted_satisfaction / total_weight if total_weight > 0 else 0
-    
-    def get_critical_needs(self) -> List[str]:
-        """Get list of needs that are critically low, prioritized by level"""
-        critical_needs = [need for need in self.needs.values() if need.is_critical()]
-        critical_needs.sort(key=lambda x: x.get_priority_score(), reverse=True)
-        return [need.name for need in critical_needs]
-    
-    def get_low_needs(self) -> List[str]:
-        """Get list of needs that are low, prioritized by level"""
-        low_needs = [need for need in self.needs.values() if need.is_low()]
-        low_needs.sort(key=lambda x: x.get_priority_score(), reverse=True)
-        return [need.name for need in low_needs]
+        return {
+            'overall_satisfaction': total_weighted_satisfaction / total_weight if total_weight > 0 else 0.0,
+            'critical_needs': [name for _, name in critical_needs],
+            'low_needs': [name for _, name in low_needs]
+        }
     
     def get_priority_needs(self, top_k: int = 5) -> List[Dict[str, Any]]:
         """Get the most urgent needs to address"""
-        all_needs = list(self.needs.values())
-        all_needs.sort(key=lambda x: x.get_priority_score(), reverse=True)
-        
-        priority_needs = []
-        for need in all_needs[:top_k]:
-            priority_needs.append({
+        priority_needs = self._cached_aggregate(f'priority_{top_k}', lambda: self._compute_priority_needs(top_k))
+        return [dict(need) for need in priority_needs]
+    
+    def _compute_priority_needs(self, top_k: int) -> List[Dict[str, Any]]:
+        """Score every need once and keep the top_k without sorting the rest"""
+        scored = heapq.nlargest(top_k, ((need.get_priority_score(), need) for need in self.needs.values()),
+                                key=lambda item: item[0])
+        return [
+            {
                 'name': need.name,
                 'category': need.category.value,
                 'level': need.level.value,
                 'satisfaction': need.satisfaction,
-                'priority_score': need.get_priority_score(),
+                'priority_score': priority_score,
                 'is_critical': need.is_critical(),
                 'is_low': need.is_low()
-            })
-        
-        return priority_needs
+            }
+            for priority_score, need in scored
+        ]
     
     def get_growth_insights(self) -> Dict[str, Any]:
         """Get insights about personal growth and development"""
+        insights = self._cached_aggregate(f'growth_insights_{self.growth_stage}', self._compute_growth_insights)
+        return {
+            **insights,
+            'level_satisfactions': dict(insights['level_satisfactions']),
+            'next_priorities': [dict(need) for need in insights['next_priorities']],
+            'growth_opportunities': [dict(opportunity) for opportunity in insights['growth_opportunities']]
+        }
+    
+    def _compute_growth_insights(self) -> Dict[str, Any]:
+        """Build the growth insights, cached until a need or the growth stage changes"""
         insights = {
             'current_stage': self.growth_stage,
             'stage_name': self._get_stage_name(self.growth_stage),
@@ -332,8 +498,12 @@ class MaslowNeedsSystem:
         }
         
         # Level satisfactions
+        grouped = self._group_needs_by_level()
         for level in NeedLevel:
-            insights['level_satisfactions'][level.name] = self.get_level_satisfaction(level)
+            level_needs = grouped.get(level)
+            insights['level_satisfactions'][level.name] = (
+                sum(need.satisfaction for need in level_needs) / len(level_needs) if level_needs else 0.0
+            )
         
         # Next priorities
         insights['next_priorities'] = self.get_priority_needs(3)
@@ -378,37 +548,90 @@ class MaslowNeedsSystem:
             growth_rate=growth_rate,
             max_satisfaction=max_satisfaction
         )
+        self.mark_needs_changed()
     
     def remove_need(self, name: str):
         """Remove a need from the system"""
         if name in self.needs:
-            del self.needs[name]
+            self.needs.pop(name)._owner = None
+            self.mark_needs_changed()
     
     def get_needs_summary(self) -> Dict[str, Any]:
         """Get a comprehensive summary of all needs"""
+        summary = self._cached_aggregate(f'summary_{self.growth_stage}', self._compute_needs_summary)
+        return {
+            **summary,
+            'level_summaries': {level: dict(level_summary) for level, level_summary in summary['level_summaries'].items()},
+            'priority_needs': [dict(need) for need in summary['priority_needs']]
+        }
+    
+    def _compute_needs_summary(self) -> Dict[str, Any]:
+        """Build the needs summary, cached until a need or the growth stage changes"""
+        aggregates = self._satisfaction_aggregates()
         summary = {
-            'overall_satisfaction': self.get_overall_satisfaction(),
+            'overall_satisfaction': aggregates['overall_satisfaction'],
             'growth_stage': self.growth_stage,
             'stage_name': self._get_stage_name(self.growth_stage),
-            'critical_needs_count': len(self.get_critical_needs()),
-            'low_needs_count': len(self.get_low_needs()),
+            'critical_needs_count': len(aggregates['critical_needs']),
+            'low_needs_count': len(aggregates['low_needs']),
             'level_summaries': {},
             'priority_needs': self.get_priority_needs(5)
         }
         
         # Summarize each level
-        for level in NeedLevel:
-            level_needs = [need for need in self.needs.values() if need.level == level]
-            if level_needs:
+        for level, stats in self._cached_aggregate('level_stats', self._compute_level_stats).items():
+            if stats['need_count']:
                 summary['level_summaries'][level.name] = {
-                    'average_satisfaction': sum(need.satisfaction for need in level_needs) / len(level_needs),
-                    'need_count': len(level_needs),
-                    'critical_count': len([need for need in level_needs if need.is_critical()]),
-                    'low_count': len([need for need in level_needs if need.is_low()])
+                    'average_satisfaction': stats['satisfaction'],
+                    'need_count': stats['need_count'],
+                    'critical_count': stats['critical_count'],
+                    'low_count': stats['low_count']
                 }
         
         return summary
     
+    def get_decision_prompt_fields(self) -> Dict[str, Any]:
+        """Get the needs-dependent inputs of the Maslow decision prompt"""
+        fields = self._cached_aggregate(f'decision_prompt_fields_{self.growth_stage}', self._compute_decision_prompt_fields)
+        return dict(fields)
+    
+    def _compute_decision_prompt_fields(self) -> Dict[str, Any]:
+        """Format the decision prompt inputs, cached until a need or the growth stage changes"""
+        needs_summary = self.get_needs_summary()
+        growth_insights = self.get_growth_insights()
+        
+        # Format level satisfactions
+        level_satisfactions_str = "".join([
+            f"- {level_name}: {satisfaction:.1f}%\n"
+            for level_name, satisfaction in growth_insights['level_satisfactions'].items()
+        ])
+        
+        # Format priority needs
+        priority_needs_str = "".join([
+            f"{i}. {need['name']} (Level {need['level']}): {need['satisfaction']:.1f}% - {'CRITICAL' if need['is_critical'] else 'LOW' if need['is_low'] else 'OK'}\n"
+            for i, need in enumerate(needs_summary['priority_needs'], 1)
+        ])
+        
+        # Format growth opportunities
+        growth_opportunities_str = "".join([
+            f"- {opportunity['name']}: {opportunity['current']:.1f}/{opportunity['potential']:.1f} (room for {opportunity['growth_room']:.1f})\n"
+            for opportunity in growth_insights['growth_opportunities']
+        ])
+        
+        return {
+            'current_stage': needs_summary['growth_stage'],
+            'stage_name': needs_summary['stage_name'],
+            'overall_satisfaction': needs_summary['overall_satisfaction'],
+            'level_satisfactions': level_satisfactions_str,
+            'priority_needs': priority_needs_str,
+            'critical_needs': needs_summary['critical_needs_count'],
+            'growth_opportunities': growth_opportunities_str
+        }
+    
+    def get_basic_needs_prompt(self) -> str:
+        """Get the basic needs prompt, rendered once per needs state"""
+        return self._cached_aggregate('basic_needs_prompt', lambda: _format_basic_needs_prompt(self))
+    
     def __str__(self):
         """String representation of the needs system"""
         summary = self.get_needs_summary()
@@ -457,11 +680,12 @@ class MaslowNeedsSystem:
             )
             system.needs[name] = need
         
+        system.mark_needs_changed()
         return system
 
 
 # Backward compatibility classes and functions
-@dataclass
+@dataclass(**_SLOTS)
 class Need:
     """Legacy Need class for backward compatibility"""
     name: str
@@ -487,6 +711,7 @@ class Need:
 
 class BasicNeeds:
     """Legacy BasicNeeds class for backward compatibility - now wraps MaslowNeedsSystem"""
+    __slots__ = ('maslow_system', 'legacy_mapping')
     
     def __init__(self):
         self.maslow_system = MaslowNeedsSystem()
@@ -563,18 +788,9 @@ class BasicNeeds:
         return f"BasicNeeds(overall: {self.get_overall_satisfaction():.1f}%, {needs_str})"
 
 
-def create_basic_needs_chain(llm_json_mode, person: BasicNeeds):
-    """Legacy function for backward compatibility - now uses Maslow decision system"""
-    from core.needs.maslow_decision_chain import create_maslow_decision_chain
-    
-    # Convert BasicNeeds to MaslowNeedsSystem for decision making
-    if hasattr(person, 'maslow_system'):
-        return create_maslow_decision_chain(llm_json_mode, person.maslow_system)
-    else:
-        # Fallback to basic decision making
-        needs_prompt = PromptTemplate(
-            input_variables=["needs_status", "overall_satisfaction", "critical_needs", "low_needs"],
-            template="""You are an AI making decisions based on basic needs.
+BASIC_NEEDS_PROMPT = PromptTemplate(
+    input_variables=["needs_status", "overall_satisfaction", "critical_needs", "low_needs"],
+    template="""You are an AI making decisions based on basic needs.
 
 Current needs status: {needs_status}
 Overall satisfaction: {overall_satisfaction:.1f}%
@@ -591,24 +807,134 @@ Consider:
 - Low needs (below 50%): Should address soon
 - Above 50%: Can continue other activities
 - Prioritize the most critical needs first"""
-        )
+)
 
-        # Prepare the needs status string
-        needs_status = ", ".join([f"{name}: {need.satisfaction:.1f}%" for name, need in person.needs.items()])
-        
+
+# Answers to rendered needs prompts, one LRU cache per LLM keyed by prompt digest.
+# Identical needs produce an identical prompt, so repeat decisions skip the LLM
+# round-trip. LLM clients are unhashable pydantic models, so the caches are found
+# by identity and dropped when their LLM is collected, before its id can be reused.
+NEEDS_RESPONSE_CACHE_SIZE = 256
+_needs_response_caches: "Dict[int, OrderedDict[bytes, str]]" = {}
+_needs_response_lock = threading.Lock()
+
+
+def _needs_response_cache_for(llm_json_mode) -> Optional["OrderedDict[bytes, str]"]:
+    """Return llm_json_mode's response cache, or None if the LLM can't be tracked"""
+    llm_id = id(llm_json_mode)
+    with _needs_response_lock:
+        cache = _needs_response_caches.get(llm_id)
+        if cache is None:
+            try:
+                weakref.finalize(llm_json_mode, _needs_response_caches.pop, llm_id, None)
+            except TypeError:
+                # Not weak-referenceable, so there is no safe way to tell when its id is reused
+                return None
+            cache = _needs_response_caches[llm_id] = OrderedDict()
+        return cache
+
+
+def _needs_cache_key(prompt_text: str) -> bytes:
+    return hashlib.blake2b(prompt_text.encode(), digest_size=16).digest()
+
+
+def _get_cached_needs_response(cache, key: bytes) -> Optional[str]:
+    if cache is None:
+        return None
+    with _needs_response_lock:
+        cached = cache.get(key)
+        if cached is not None:
+            cache.move_to_end(key)
+        return cached
+
+
+def _put_cached_needs_response(cache, key: bytes, response) -> str:
+    response_content = response.content if hasattr(response, 'content') else str(response)
+    if cache is not None:
+        with _needs_response_lock:
+            cache[key] = response_content
+            if len(cache) > NEEDS_RESPONSE_CACHE_SIZE:
+                cache.popitem(last=False)
+    return response_content
+
+
+def invoke_needs_prompt(llm_json_mode, prompt_text: str) -> str:
+    """Invoke the LLM with a rendered needs prompt, reusing the answer to an identical earlier prompt"""
+    cache = _needs_response_cache_for(llm_json_mode)
+    key = _needs_cache_key(prompt_text)
+    cached = _get_cached_needs_response(cache, key)
+    if cached is not None:
+        return cached
+    return _put_cached_needs_response(cache, key, llm_json_mode.invoke(prompt_text))
+
+
+def invoke_needs_prompts_batch(llm_json_mode, prompt_texts: List[str]) -> List[str]:
+    """Answer several rendered needs prompts, sending all uncached ones in a single llm.batch call"""
+    cache = _needs_response_cache_for(llm_json_mode)
+    keys = [_needs_cache_key(prompt_text) for prompt_text in prompt_texts]
+    answers = {key: _get_cached_needs_response(cache, key) for key in keys}
+    
+    # Identical prompts in one batch are only sent once
+    pending = {key: prompt_text for key, prompt_text in zip(keys, prompt_texts) if answers[key] is None}
+    if pending:
+        responses = llm_json_mode.batch(list(pending.values()))
+        for key, response in zip(pending, responses):
+            answers[key] = _put_cached_needs_response(cache, key, response)
+    
+    return [answers[key] for key in keys]
+
+
+def clear_needs_response_cache():
+    """Forget all cached needs prompt answers"""
+    with _needs_response_lock:
+        # list() because a collected LLM's finalizer may drop its cache meanwhile
+        for cache in list(_needs_response_caches.values()):
+            cache.clear()
+
+
+def render_basic_needs_prompt(person: BasicNeeds) -> str:
+    """Render the decision prompt create_basic_needs_chain sends for person"""
+    from core.needs.maslow_decision_chain import render_maslow_decision_prompt
+    
+    # Convert BasicNeeds to MaslowNeedsSystem for decision making
+    if hasattr(person, 'maslow_system'):
+        return render_maslow_decision_prompt(person.maslow_system)
+    
+    # Fallback to basic decision making; a needs system keeps the rendered prompt
+    # with its other cached aggregates
+    if isinstance(person, MaslowNeedsSystem):
+        return person.get_basic_needs_prompt()
+    return _format_basic_needs_prompt(person)
+
+
+def _format_basic_needs_prompt(person) -> str:
+    # Prepare the needs status string
+    needs_status = ", ".join([f"{name}: {need.satisfaction:.1f}%" for name, need in person.needs.items()])
+    return BASIC_NEEDS_PROMPT.format(
+        needs_status=needs_status,
+        overall_satisfaction=person.get_overall_satisfaction(),
+        critical_needs=person.get_critical_needs(),
+        low_needs=person.get_low_needs()
+    )
+
+
+def create_basic_needs_chain(llm_json_mode, person: BasicNeeds):
+    """Legacy function for backward compatibility - now uses Maslow decision system"""
+    from core.needs.maslow_decision_chain import create_maslow_decision_chain
+    
+    # Convert BasicNeeds to MaslowNeedsSystem for decision making
+    if hasattr(person, 'maslow_system'):
+        return create_maslow_decision_chain(llm_json_mode, person.maslow_system)
+    else:
         # Use the newer invoke method instead of run
-        response = llm_json_mode.invoke(
-            needs_prompt.format(
-                needs_status=needs_status,
-                overall_satisfaction=person.get_overall_satisfaction(),
-                critical_needs=person.get_critical_needs(),
-                low_needs=person.get_low_needs()
-            )
-        )
+        response_content = invoke_needs_prompt(llm_json_mode, render_basic_needs_prompt(person))
         
-        # Extract content from the response
-        response_content = response.content if hasattr(response, 'content') else str(response)
-        
-        print(f"Current state: {person}")
-        print(f"AI Decision: {response_content}")
-        return response_content 
\ No newline at end of file
+        # Lazy %s formatting: the person is only stringified when debug logging is on
+        logger.debug("Current state: %s", person)
+        logger.debug("AI Decision: %s", response_content)
+        return response_content
+
+
+def create_basic_needs_chain_batch(llm_json_mode, people: List[BasicNeeds]) -> List[str]:
+    """Run create_basic_needs_chain for several needs states with one batched LLM call"""
+    return invoke_needs_prompts_batch(llm_json_mode, [render_basic_needs_prompt(person) for person in people])
@@ -1,10 +1,14 @@
+import sys
 from dataclasses import dataclass, field
 from typing import List, Dict, Any
 from ..needs.maslow_needs import MaslowNeedsSystem
 from datetime import datetime
 
+# dataclass(slots=True) needs Python 3.10; older interpreters get regular instances
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Message:
     """Represents a single message in a conversation"""
     timestamp: datetime
@@ -13,7 +17,7 @@ class Message:
     message_type: str = "text"  # text, action, system, etc.
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Conversation:
     """Represents a conversation with a specific outsider"""
     outsider_name: str
@@ -43,7 +47,7 @@ class Conversation:
         return f"Conversation with {self.outsider_name} ({len(self.messages)} messages, last: {self.last_interaction.strftime('%Y-%m-%d %H:%M')})"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Person:
     name: str = "Jenbina"
     maslow_needs: MaslowNeedsSystem = None
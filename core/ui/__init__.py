@@ -2,7 +2,9 @@
 from .sidebar import render_full_sidebar
 from .simulation import (
     render_simulation_controls,
+    start_simulation_loop,
     run_simulation_loop,
+    schedule_simulation_rerun,
     run_single_iteration,
     display_simulation_summary,
     get_person_dict
@@ -12,7 +14,9 @@ from .chat import render_chat_interface
 __all__ = [
     'render_full_sidebar',
     'render_simulation_controls',
+    'start_simulation_loop',
     'run_simulation_loop',
+    'schedule_simulation_rerun',
     'run_single_iteration',
     'display_simulation_summary',
     'get_person_dict',
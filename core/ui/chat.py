@@ -1,16 +1,20 @@
 """Chat UI components for Jenbina app"""
+import logging
 import streamlit as st
 from core.interaction.chat_handler import handle_chat_interaction
 
+logger = logging.getLogger(__name__)
+
 
 def display_person_state_compact(person):
     """Display current person state in compact form"""
+    snap = person.maslow_needs.snapshot()
     st.write("**Current State:**")
     st.write(f"- Name: {person.name}")
-    st.write(f"- Overall Satisfaction: {person.maslow_needs.get_overall_satisfaction():.1f}%")
-    st.write(f"- Hunger: {person.maslow_needs.get_need_satisfaction('hunger'):.1f}%")
-    st.write(f"- Sleep: {person.maslow_needs.get_need_satisfaction('sleep'):.1f}%")
-    st.write(f"- Safety: {person.maslow_needs.get_need_satisfaction('security'):.1f}%")
+    st.write(f"- Overall Satisfaction: {snap.overall_satisfaction:.1f}%")
+    st.write(f"- Hunger: {snap.get_need_satisfaction('hunger'):.1f}%")
+    st.write(f"- Sleep: {snap.get_need_satisfaction('sleep'):.1f}%")
+    st.write(f"- Safety: {snap.get_need_satisfaction('security'):.1f}%")
 
 
 def handle_user_input(person, llm, memory_manager, debug_mode):
@@ -18,7 +22,7 @@ def handle_user_input(person, llm, memory_manager, debug_mode):
     user_input = st.chat_input("Talk to Jenbina...")
     
     if user_input:
-        print("User input:", user_input)
+        logger.debug("User input: %s", user_input)
         
         # Store the user message in person's communication history
         person.receive_message("User", user_input, "text")
@@ -45,7 +49,7 @@ def handle_user_input(person, llm, memory_manager, debug_mode):
             debug_mode=debug_mode
         )
         
-        print(chat_result)
+        logger.debug("Chat result: %s", chat_result)
         
         # Store the person's response
         if "assistant_response" in chat_result:
@@ -67,17 +71,23 @@ def handle_user_input(person, llm, memory_manager, debug_mode):
     return None
 
 
+@st.fragment
 def display_communication_stats(person):
-    """Display communication statistics"""
-    with st.expander("Communication Statistics", expanded=False):
-        comm_stats = person.get_communication_stats()
-        st.write(f"**Total Conversations:** {comm_stats['total_conversations']}")
-        st.write(f"**Total Messages:** {comm_stats['total_messages']}")
-        
-        if comm_stats['most_active_conversations']:
-            st.write("**Most Active Conversations:**")
-            for conv in comm_stats['most_active_conversations']:
-                st.write(f"- {conv['outsider']}: {conv['message_count']} messages")
+    """Display communication statistics with checkbox toggle; toggling reruns only this fragment"""
+    show_comm = st.checkbox("📊 Show Communication Statistics", value=False, key="show_comm_stats")
+    if not show_comm:
+        return
+    
+    comm_stats = person.get_communication_stats()
+    st.write(f"**Total Conversations:** {comm_stats['total_conversations']}")
+    st.write(f"**Total Messages:** {comm_stats['total_messages']}")
+    
+    if comm_stats['most_active_conversations']:
+        st.write("**Most Active Conversations:**")
+        st.markdown("\n".join(
+            f"- {conv['outsider']}: {conv['message_count']} messages"
+            for conv in comm_stats['most_active_conversations']
+        ))
 
 
 def display_conversation_history(person):
@@ -89,30 +99,37 @@ def display_conversation_history(person):
             st.write(f"**Last Interaction:** {user_summary['last_interaction'].strftime('%Y-%m-%d %H:%M')}")
             
             st.write("**Recent Messages:**")
-            for msg in user_summary['recent_messages']:
-                sender_icon = "👤" if msg['sender'] == "User" else "🤖"
-                st.write(f"{sender_icon} **{msg['sender']}** ({msg['timestamp'].strftime('%H:%M')}): {msg['content']}")
+            st.markdown("\n\n".join(
+                f"{'👤' if msg['sender'] == 'User' else '🤖'} **{msg['sender']}** "
+                f"({msg['timestamp'].strftime('%H:%M')}): {msg['content']}"
+                for msg in user_summary['recent_messages']
+            ))
         else:
             st.write("No conversation history yet.")
 
 
+@st.fragment
 def display_memory_stats(memory_manager):
-    """Display memory system statistics"""
-    with st.expander("Memory System Statistics", expanded=False):
-        memory_stats = memory_manager.get_memory_stats()
-        st.write(f"**Total Conversations in Memory:** {memory_stats.get('total_conversations', 0)}")
-        st.write(f"**Unique People:** {memory_stats.get('unique_people', 0)}")
-        st.write(f"**Memory Size:** {memory_stats.get('memory_size_mb', 0)} MB")
-        
-        if memory_stats.get('people'):
-            st.write("**People in Memory:**")
-            for person_name in memory_stats['people']:
-                st.write(f"- {person_name}")
-        
-        if memory_stats.get('message_types'):
-            st.write("**Message Types:**")
-            for msg_type, count in memory_stats['message_types'].items():
-                st.write(f"- {msg_type}: {count}")
+    """Display memory system statistics with checkbox toggle; toggling reruns only this fragment"""
+    show_memory = st.checkbox("🧠 Show Memory System Statistics", value=False, key="show_memory_stats")
+    if not show_memory:
+        return
+    
+    memory_stats = memory_manager.get_memory_stats()
+    st.write(f"**Total Conversations in Memory:** {memory_stats.get('total_conversations', 0)}")
+    st.write(f"**Unique People:** {memory_stats.get('unique_people', 0)}")
+    st.write(f"**Memory Size:** {memory_stats.get('memory_size_mb', 0)} MB")
+    
+    if memory_stats.get('people'):
+        st.write("**People in Memory:**")
+        st.markdown("\n".join(f"- {person_name}" for person_name in memory_stats['people']))
+    
+    if memory_stats.get('message_types'):
+        st.write("**Message Types:**")
+        st.markdown("\n".join(
+            f"- {msg_type}: {count}"
+            for msg_type, count in memory_stats['message_types'].items()
+        ))
 
 
 def display_memory_debug(memory_manager):
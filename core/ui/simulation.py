@@ -1,63 +1,172 @@
 """Simulation UI components and runner for Jenbina app"""
 import streamlit as st
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+import functools
+import itertools
+import json
 import time
 
-from core.needs.maslow_needs import create_basic_needs_chain
-from core.cognition.asimov_check_chain import create_asimov_check_system
-from core.cognition.state_analysis_chain import create_state_analysis_system
-from core.environment.world_state import create_world_description_system, create_comprehensive_world_state, get_world_state_summary
-from core.cognition.enhanced_action_decision_chain import create_meta_cognitive_action_chain
+# orjson ships with chromadb; fall back to the stdlib encoder without it
+try:
+    import orjson
 
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-def get_person_dict(person):
+
+@functools.lru_cache(maxsize=None)
+def _load_chains():
+    """Import the LLM chain factories on first use, so pages that never run a simulation skip them"""
+    from core.needs.maslow_needs import create_basic_needs_chain
+    from core.cognition.post_action_chain import create_post_action_system
+    from core.environment.world_state import create_world_description_system, create_comprehensive_world_state, get_world_state_summary
+    from core.cognition.enhanced_action_decision_chain import create_meta_cognitive_action_chain
+    
+    return SimpleNamespace(
+        create_basic_needs_chain=create_basic_needs_chain,
+        create_post_action_system=create_post_action_system,
+        create_world_description_system=create_world_description_system,
+        create_comprehensive_world_state=create_comprehensive_world_state,
+        get_world_state_summary=get_world_state_summary,
+        create_meta_cognitive_action_chain=create_meta_cognitive_action_chain
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def _cached_chain(factory_name, llm_id, _llm):
+    """Build a chain closure once per factory and LLM instance so iterations reuse its prompts"""
+    return getattr(_load_chains(), factory_name)(_llm)
+
+
+@st.cache_resource(show_spinner=False)
+def _cached_post_action_chain(llm_id, draft_llm_id, _llm, _draft_llm):
+    """Build the post-action chain once per main/draft LLM pair"""
+    return _load_chains().create_post_action_system(_llm, draft_llm=_draft_llm)
+
+
+@st.cache_resource(show_spinner=False)
+def _prefetch_executor():
+    """Background worker shared by all sessions for LLM calls started during the inter-iteration delay"""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="jenbina-prefetch")
+
+
+# Hours covered by one world state before weather, time and open locations are rebuilt
+WORLD_REFRESH_HOURS = 3
+
+
+def get_session_world(location="Jenbina's House"):
+    """Reuse the session's world state, rebuilding it only when the location or time bucket changes"""
+    now = datetime.now()
+    world_key = (location, now.date(), now.hour // WORLD_REFRESH_HOURS)
+    world = st.session_state.get("world_state")
+    
+    if world is None or st.session_state.get("world_state_key") != world_key:
+        previous = world
+        world = _load_chains().create_comprehensive_world_state(person_location=location)
+        if previous is not None:
+            # Carry the description context over so the world stays coherent
+            world.last_descriptions.extend(previous.last_descriptions)
+        st.session_state.world_state = world
+        st.session_state.world_state_key = world_key
+    
+    return world
+
+
+def get_session_world_summary(world):
+    """Summarize the session world once; the summary only changes when the world is rebuilt"""
+    cached = st.session_state.get("world_state_summary")
+    if cached is None or cached[0] is not world:
+        cached = (world, _load_chains().get_world_state_summary(world))
+        st.session_state.world_state_summary = cached
+    return cached[1]
+
+
+def prefetch_world_description(person, llm_json_mode):
+    """Start the next iteration's world description in the background while the loop waits.
+    
+    Needs only change again once the next iteration runs, so the inputs are already final.
+    Returns the (world, future) pair run_single_iteration accepts as prefetched_world, or
+    None when the next iteration will reuse a cached decision and its world description.
+    """
+    world = get_session_world(location="Jenbina's House")
+    decision_cache = st.session_state.get("decision_cache")
+    if decision_cache and decision_cache.make_key(person, world) in decision_cache:
+        return None
+    world_chain = _cached_chain("create_world_description_system", id(llm_json_mode), llm_json_mode)
+    return world, _prefetch_executor().submit(world_chain, person, world)
+
+
+def get_person_dict(person, snap=None):
     """Get person state as dictionary for display"""
+    snap = snap or person.maslow_needs.snapshot()
     return {
         "name": person.name,
         "maslow_needs": {
-            "overall_satisfaction": person.maslow_needs.get_overall_satisfaction(),
+            "overall_satisfaction": snap.overall_satisfaction,
             "individual_needs": {
-                need_name: person.maslow_needs.get_need_satisfaction(need_name)
+                need_name: snap.get_need_satisfaction(need_name)
                 for need_name in ["hunger", "sleep", "security", "love", "esteem", "self_actualization"]
-                if person.maslow_needs.get_need_satisfaction(need_name) > 0
+                if snap.get_need_satisfaction(need_name) > 0
             },
-            "critical_needs": person.maslow_needs.get_critical_needs(),
-            "low_needs": person.maslow_needs.get_low_needs()
+            "critical_needs": snap.critical_needs,
+            "low_needs": snap.low_needs
         }
     }
 
 
-def display_person_state(person):
+def display_person_state(person, snap=None):
     """Display current person state"""
+    snap = snap or person.maslow_needs.snapshot()
     st.write("### Current Jenbina State:")
     st.write(f"- Name: {person.name}")
-    st.write(f"- Overall Satisfaction: {person.maslow_needs.get_overall_satisfaction():.1f}%")
-    st.write(f"- Hunger: {person.maslow_needs.get_need_satisfaction('hunger'):.1f}%")
-    st.write(f"- Sleep: {person.maslow_needs.get_need_satisfaction('sleep'):.1f}%")
-    st.write(f"- Safety: {person.maslow_needs.get_need_satisfaction('security'):.1f}%")
+    st.write(f"- Overall Satisfaction: {snap.overall_satisfaction:.1f}%")
+    st.write(f"- Hunger: {snap.get_need_satisfaction('hunger'):.1f}%")
+    st.write(f"- Sleep: {snap.get_need_satisfaction('sleep'):.1f}%")
+    st.write(f"- Safety: {snap.get_need_satisfaction('security'):.1f}%")
 
 
-def display_world_state(world_summary, world):
+def dumps_json(data):
+    """Serialize display data to a JSON string, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, default=str)
+
+
+@st.fragment
+def display_raw_json(label, json_text, key):
+    """Render a JSON viewer only once its checkbox is ticked; toggling reruns only this fragment"""
+    if st.checkbox(f"🔍 Show {label}", value=False, key=key):
+        # st.json passes pre-serialized strings straight through
+        st.json(json_text, expanded=2)
+
+
+def display_world_state(world_summary, world_json, world, iteration):
     """Display world state information"""
     st.write("**2. World State:**")
-    st.write(f"Location: {world_summary['location']['name']}")
-    st.write(f"Time of Day: {world_summary['time']['time_of_day']}")
-    st.write(f"Weather: {world_summary['weather']['description']}")
-    st.write(f"Temperature: {world_summary['weather']['temperature']:.1f}°C")
-    st.write(f"Humidity: {world_summary['weather']['humidity']:.1f}%")
-    st.write(f"Nearby Locations: {world_summary['environment']['nearby_locations_count']}")
-    st.write(f"Open Locations: {world_summary['environment']['open_locations_count']}")
-    st.write(f"Current Events: {world_summary['environment']['current_events_count']}")
+    # One markdown element instead of a message per line; trailing spaces force line breaks
+    st.markdown("  \n".join([
+        f"Location: {world_summary['location']['name']}",
+        f"Time of Day: {world_summary['time']['time_of_day']}",
+        f"Weather: {world_summary['weather']['description']}",
+        f"Temperature: {world_summary['weather']['temperature']:.1f}°C",
+        f"Humidity: {world_summary['weather']['humidity']:.1f}%",
+        f"Nearby Locations: {world_summary['environment']['nearby_locations_count']}",
+        f"Open Locations: {world_summary['environment']['open_locations_count']}",
+        f"Current Events: {world_summary['environment']['current_events_count']}"
+    ]))
     
     if world.last_descriptions:
         st.write(f"Previous Descriptions: {len(world.last_descriptions)} items")
     
-    st.write("**World State (JSON):**")
-    st.json(world_summary)
+    display_raw_json("World State (JSON)", world_json, key=f"world_json_{iteration}")
 
 
+@st.fragment
 def display_meta_cognitive_insights(meta_cognitive_system, iteration):
-    """Display meta-cognitive insights with checkbox toggle"""
+    """Display meta-cognitive insights with checkbox toggle; toggling reruns only this fragment"""
     show_meta = st.checkbox(
         f"🧠 Show Meta-Cognitive Insights", 
         value=False, 
@@ -69,78 +178,114 @@ def display_meta_cognitive_insights(meta_cognitive_system, iteration):
         st.write(f"**Total Insights:** {meta_stats['total_insights']}")
         
         st.write("**Cognitive Biases Detected:**")
-        for bias, level in meta_stats['cognitive_biases'].items():
-            if level > 0:
-                st.write(f"- {bias}: {level:.2f}")
+        bias_lines = [
+            f"- {bias}: {level:.2f}"
+            for bias, level in meta_stats['cognitive_biases'].items()
+            if level > 0
+        ]
+        if bias_lines:
+            st.markdown("\n".join(bias_lines))
         
         if meta_stats['recent_insights']:
             st.write("**Recent Insights:**")
-            for insight in meta_stats['recent_insights']:
-                st.write(f"- **{insight['type']}**: {insight['description']}")
+            st.markdown("\n".join(
+                f"- **{insight['type']}**: {insight['description']}"
+                for insight in meta_stats['recent_insights']
+            ))
 
 
-def run_single_iteration(person, llm_json_mode, meta_cognitive_system, iteration):
+def run_single_iteration(person, llm_json_mode, meta_cognitive_system, iteration, draft_llm=None,
+                         prefetched_world=None):
     """Run a single simulation iteration and return results"""
-    iteration_start_time = datetime.now()
+    iteration_start_time = time.perf_counter()
+    chains = _load_chains()
+    
+    # Read the needs once; the state display and the JSON record share it
+    snap = person.maslow_needs.snapshot()
     
     # Display person state
-    display_person_state(person)
+    display_person_state(person, snap)
     
-    # JSON representation
-    person_dict = get_person_dict(person)
-    st.write("**Person Object (JSON):**")
-    st.json(person_dict)
+    # JSON representation, serialized once and kept so finished iterations can show it too
+    person_dict = get_person_dict(person, snap)
+    person_json = dumps_json(person_dict)
+    display_raw_json("Person Object (JSON)", person_json, key=f"person_json_{iteration}")
     
-    # Basic needs analysis
-    st.write("**1. Basic Needs Analysis:**")
-    needs_response = create_basic_needs_chain(llm_json_mode, person.maslow_needs)
-    st.write(needs_response)
+    # World state persists across iterations so previous descriptions accumulate
+    world = get_session_world(location="Jenbina's House")
+    world_summary = get_session_world_summary(world)
+    world_json = dumps_json(world_summary)
     
-    # World state and description
-    world = create_comprehensive_world_state(person_location="Jenbina's House")
-    world_summary = get_world_state_summary(world)
-    display_world_state(world_summary, world)
+    # A cached decision comes with the world description it was made from,
+    # so a hit skips the world description call as well
+    decision_cache = st.session_state.get("decision_cache")
+    cache_key = decision_cache.make_key(person, world) if decision_cache else None
+    cached = decision_cache.lookup(cache_key) if decision_cache else None
     
-    # World description from LLM
-    st.write("**2.1 World Description:**")
-    world_chain = create_world_description_system(llm_json_mode)
-    world_response = world_chain(person, world)
-    st.write(world_response)
+    # Basic needs analysis and world description don't depend on each other, so the
+    # needs call runs in the background while the world description streams in here;
+    # Streamlit output stays on this thread
+    world_chain = _cached_chain("create_world_description_system", id(llm_json_mode), llm_json_mode)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        needs_future = executor.submit(chains.create_basic_needs_chain, llm_json_mode, person.maslow_needs)
+        
+        st.write("**1. Basic Needs Analysis:**")
+        needs_slot = st.empty()
+        
+        display_world_state(world_summary, world_json, world, iteration)
+        
+        # World description from LLM
+        st.write("**2.1 World Description:**")
+        if cached is not None:
+            action_response, world_response = cached
+            st.write(world_response)
+        else:
+            if prefetched_world is not None and prefetched_world[0] is world:
+                world_response = prefetched_world[1].result()
+                st.write(world_response)
+            else:
+                world_response = st.write_stream(world_chain(person, world, stream=True))
+            world.add_description(world_response)
+        
+        needs_response = needs_future.result()
+        needs_slot.write(needs_response)
     
     # Enhanced action decision with meta-cognition
     st.write("**3. Action Decision (with Meta-Cognition):**")
-    action_response = create_meta_cognitive_action_chain(
-        llm=llm_json_mode,
-        person=person,
-        world_description=world_response,
-        meta_cognitive_system=meta_cognitive_system,
-        world_state=world
-    )
+    if cached is not None:
+        st.caption("♻️ Reused decision from a similar earlier state")
+    else:
+        action_response = chains.create_meta_cognitive_action_chain(
+            llm=llm_json_mode,
+            person=person,
+            world_description=world_response,
+            meta_cognitive_system=meta_cognitive_system,
+            world_state=world
+        )
+        if decision_cache:
+            decision_cache.put(cache_key, action_response, world_response)
     st.write(action_response)
     
     # Meta-cognitive insights
     display_meta_cognitive_insights(meta_cognitive_system, iteration)
     
-    # Asimov compliance check
+    # Asimov compliance check and state analysis share one LLM call
+    post_action_chain = _cached_post_action_chain(id(llm_json_mode), id(draft_llm), llm_json_mode, draft_llm)
+    post_action = post_action_chain(action_response)
+    asimov_response = post_action["asimov_compliance"]
+    state_response = post_action["state_analysis"]
+    
     st.write("**5. Asimov Compliance Check:**")
-    asimov_chain = create_asimov_check_system(llm_json_mode)
-    asimov_response = asimov_chain(action_response)
     st.write(asimov_response)
     
-    # State analysis
     st.write("**4. State Analysis:**")
-    state_response = create_state_analysis_system(
-        llm_json_mode, 
-        action_decision=action_response, 
-        compliance_check=asimov_response
-    )
     st.write(state_response)
     
     # Update person's needs
     person.update_all_needs()
     
     # Calculate duration
-    iteration_duration = (datetime.now() - iteration_start_time).total_seconds()
+    iteration_duration = time.perf_counter() - iteration_start_time
     st.write(f"✅ Iteration {iteration + 1} completed in {iteration_duration:.2f}s")
     
     # Return results for session state
@@ -150,54 +295,134 @@ def run_single_iteration(person, llm_json_mode, meta_cognitive_system, iteration
         "action_decision": action_response,
         "state_response": state_response,
         "person_dict": person_dict,
+        "person_json": person_json,
         "world_summary": world_summary,
+        "world_json": world_json,
         "iteration_duration": iteration_duration
     }
 
 
-def run_simulation_loop(person, llm_json_mode, meta_cognitive_system, iterations, delay_seconds):
-    """Run the simulation loop for specified iterations"""
+def start_simulation_loop(iterations, delay_seconds):
+    """Queue a simulation run that run_simulation_loop advances across reruns"""
+    st.session_state.sim_state = {
+        "stage": "running",
+        "iteration": 0,
+        "iterations": iterations,
+        "delay_seconds": delay_seconds,
+        "next_iter_at": 0.0,
+        "results": [],
+        "rendered": []
+    }
+
+
+def render_iteration_markdown(record):
+    """Render a finished iteration record to markdown once so reruns can redraw it cheaply"""
+    action = record["action_decision"]
+    if isinstance(action, dict):
+        chosen = action.get("chosen_action", "Unknown")
+    else:
+        chosen = str(action)[:100]
+    
+    needs = record["needs_state"]
+    lines = [
+        f"✅ Completed in {record['duration_seconds']:.2f}s",
+        f"**Action Decision:** {chosen}",
+        f"**Overall Satisfaction:** {needs.get('overall_satisfaction', 0):.1f}%"
+    ]
+    if needs.get("critical_needs"):
+        lines.append(f"**Critical Needs:** {', '.join(needs['critical_needs'])}")
+    if needs.get("low_needs"):
+        lines.append(f"**Low Needs:** {', '.join(needs['low_needs'])}")
+    
+    return "\n\n".join(lines)
+
+
+def run_simulation_loop(person, llm_json_mode, meta_cognitive_system, draft_llm=None):
+    """Advance the queued simulation by at most one iteration per script run.
+    
+    Returns the iteration records once the run has finished, otherwise None.
+    The delay between iterations is waited out by schedule_simulation_rerun
+    so the rest of the page stays responsive in the meantime.
+    """
+    sim_state = st.session_state.get("sim_state")
+    if not sim_state:
+        return None
+    
+    iterations = sim_state["iterations"]
+    
     # Progress tracking
-    progress_bar = st.progress(0)
+    progress_bar = st.progress(sim_state["iteration"] / iterations)
     status_text = st.empty()
     
-    # Container for all iterations
-    iterations_container = st.container()
+    # One slot per iteration; finished ones are refilled from their rendered markdown
+    # and stored JSON, under the same widget keys they had while running
+    placeholders = [st.empty() for _ in range(iterations)]
+    for i, (record, rendered) in enumerate(zip(sim_state["results"], sim_state["rendered"])):
+        with placeholders[i].container():
+            with st.expander(f"📍 Iteration {i + 1} of {iterations}", expanded=False):
+                st.markdown(rendered)
+                display_raw_json("Person Object (JSON)", record["person_json"], key=f"person_json_{i}")
+                display_raw_json("World State (JSON)", record["world_json"], key=f"world_json_{i}")
     
-    results = []
+    if sim_state["stage"] == "waiting":
+        remaining = sim_state["next_iter_at"] - time.time()
+        if remaining > 0:
+            status_text.text(f"⏳ Waiting {remaining:.0f} seconds before next iteration...")
+            return None
+        sim_state["stage"] = "running"
     
-    for iteration in range(iterations):
-        # Update progress
-        progress = (iteration + 1) / iterations
-        progress_bar.progress(progress)
-        status_text.text(f"🔄 Running iteration {iteration + 1} of {iterations}...")
-        
-        with iterations_container:
-            # Create expander for each iteration
-            with st.expander(f"📍 Iteration {iteration + 1} of {iterations}", expanded=(iteration == iterations - 1)):
-                result = run_single_iteration(person, llm_json_mode, meta_cognitive_system, iteration)
-                
-                # Store iteration record
-                iteration_record = {
-                    "iteration": iteration + 1,
-                    "timestamp": datetime.now().isoformat(),
-                    "duration_seconds": result["iteration_duration"],
-                    "action_decision": result["action_decision"],
-                    "needs_state": result["person_dict"]["maslow_needs"],
-                    "world_summary": result["world_summary"]
-                }
-                results.append(iteration_record)
-        
-        # Wait before next iteration (except for the last one)
-        if iteration < iterations - 1:
-            status_text.text(f"⏳ Waiting {delay_seconds} seconds before next iteration...")
-            time.sleep(delay_seconds)
+    iteration = sim_state["iteration"]
+    status_text.text(f"🔄 Running iteration {iteration + 1} of {iterations}...")
+    
+    with placeholders[iteration].container():
+        with st.expander(f"📍 Iteration {iteration + 1} of {iterations}", expanded=True):
+            result = run_single_iteration(
+                person, llm_json_mode, meta_cognitive_system, iteration, draft_llm,
+                prefetched_world=sim_state.pop("prefetched_world", None)
+            )
+    
+    # Store iteration record
+    iteration_record = {
+        "iteration": iteration + 1,
+        "timestamp": datetime.now().isoformat(),
+        "duration_seconds": result["iteration_duration"],
+        "action_decision": result["action_decision"],
+        "needs_state": result["person_dict"]["maslow_needs"],
+        "world_summary": result["world_summary"],
+        "person_json": result["person_json"],
+        "world_json": result["world_json"]
+    }
+    sim_state["results"].append(iteration_record)
+    sim_state["rendered"].append(render_iteration_markdown(iteration_record))
+    sim_state["iteration"] += 1
+    progress_bar.progress(sim_state["iteration"] / iterations)
+    
+    # Schedule the next iteration (except after the last one)
+    if sim_state["iteration"] < iterations:
+        sim_state["stage"] = "waiting"
+        sim_state["next_iter_at"] = time.time() + sim_state["delay_seconds"]
+        # Use the delay to get the next world description underway
+        sim_state["prefetched_world"] = prefetch_world_description(person, llm_json_mode)
+        status_text.text(f"⏳ Waiting {sim_state['delay_seconds']} seconds before next iteration...")
+        return None
     
     # Simulation completed
-    progress_bar.progress(1.0)
     status_text.text(f"✅ Simulation completed! Ran {iterations} iteration(s).")
+    del st.session_state.sim_state
+    
+    return sim_state["results"]
+
+
+def schedule_simulation_rerun():
+    """Rerun the script once a waiting simulation is due for its next iteration"""
+    sim_state = st.session_state.get("sim_state")
+    if not sim_state or sim_state["stage"] != "waiting":
+        return
     
-    return results
+    # Wait in short slices so widget interactions are picked up between reruns
+    remaining = sim_state["next_iter_at"] - time.time()
+    time.sleep(max(0.0, min(remaining, 1.0)))
+    st.rerun()
 
 
 def display_simulation_summary(simulation_history, iterations):
@@ -208,22 +433,30 @@ def display_simulation_summary(simulation_history, iterations):
         with st.expander("📊 Simulation History Summary", expanded=True):
             st.write(f"**Total Iterations:** {len(simulation_history)}")
             
+            # simulation_history may be a bounded deque, which doesn't support slicing
+            recent_records = list(itertools.islice(
+                simulation_history, max(len(simulation_history) - iterations, 0), None
+            ))
+            
             # Show action decisions across iterations
-            st.write("**Action Decisions:**")
-            for record in simulation_history[-iterations:]:
+            action_lines = []
+            for record in recent_records:
                 action = record.get("action_decision", {})
                 if isinstance(action, dict):
                     chosen = action.get("chosen_action", "Unknown")
                 else:
                     chosen = str(action)[:100]
-                st.write(f"- Iteration {record['iteration']}: {chosen}")
+                action_lines.append(f"- Iteration {record['iteration']}: {chosen}")
+            st.write("**Action Decisions:**")
+            st.markdown("\n".join(action_lines))
             
             # Show needs evolution
             st.write("**Needs Evolution:**")
-            for record in simulation_history[-iterations:]:
-                needs = record.get("needs_state", {})
-                overall = needs.get("overall_satisfaction", 0)
-                st.write(f"- Iteration {record['iteration']}: Overall Satisfaction {overall:.1f}%")
+            st.markdown("\n".join(
+                f"- Iteration {record['iteration']}: Overall Satisfaction "
+                f"{record.get('needs_state', {}).get('overall_satisfaction', 0):.1f}%"
+                for record in recent_records
+            ))
 
 
 def render_simulation_controls():
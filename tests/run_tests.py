@@ -7,7 +7,11 @@ Runs all test modules and provides a summary
 import unittest
 import sys
 import os
+import io
+import glob
 import time
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 
 # Add the core directory to the path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'core'))
@@ -50,6 +54,60 @@ def run_all_tests():
     # Return success/failure
     return len(result.failures) == 0 and len(result.errors) == 0
 
+def _run_module_isolated(test_file):
+    """Run one test module in a scratch working directory and return picklable results"""
+    tests_dir = os.path.dirname(os.path.abspath(__file__))
+    
+    # Memory tests write their default stores (./jenbina_memory, ...) relative to the
+    # working directory, so each worker gets its own to keep modules from sharing them
+    with tempfile.TemporaryDirectory(prefix="jenbina-tests-") as scratch_dir:
+        os.chdir(scratch_dir)
+        suite = unittest.TestLoader().discover(tests_dir, pattern=test_file)
+        result = unittest.TextTestRunner(stream=io.StringIO(), verbosity=0).run(suite)
+        os.chdir(tests_dir)
+    
+    return {
+        "tests_run": result.testsRun,
+        "failures": [(str(test), traceback) for test, traceback in result.failures],
+        "errors": [(str(test), traceback) for test, traceback in result.errors],
+        "skipped": len(result.skipped)
+    }
+
+def run_all_tests_parallel():
+    """Run each test module in its own process and print a combined summary"""
+    tests_dir = os.path.dirname(os.path.abspath(__file__))
+    test_files = sorted(os.path.basename(path) for path in glob.glob(os.path.join(tests_dir, 'test_*.py')))
+    
+    start_time = time.time()
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(_run_module_isolated, test_files))
+    end_time = time.time()
+    
+    failures = [failure for result in results for failure in result["failures"]]
+    errors = [error for result in results for error in result["errors"]]
+    
+    # Print summary
+    print("\n" + "="*60)
+    print("TEST SUMMARY")
+    print("="*60)
+    print(f"Tests run: {sum(result['tests_run'] for result in results)}")
+    print(f"Failures: {len(failures)}")
+    print(f"Errors: {len(errors)}")
+    print(f"Skipped: {sum(result['skipped'] for result in results)}")
+    print(f"Time taken: {end_time - start_time:.2f} seconds")
+    
+    if failures:
+        print("\nFAILURES:")
+        for test, traceback in failures:
+            print(f"  {test}: {traceback}")
+    
+    if errors:
+        print("\nERRORS:")
+        for test, traceback in errors:
+            print(f"  {test}: {traceback}")
+    
+    return len(failures) == 0 and len(errors) == 0
+
 def run_specific_test(test_module):
     """Run a specific test module"""
     loader = unittest.TestLoader()
@@ -64,7 +122,10 @@ def run_specific_test(test_module):
     return len(result.failures) == 0 and len(result.errors) == 0
 
 if __name__ == '__main__':
-    if len(sys.argv) > 1:
+    if sys.argv[1:] == ['--parallel']:
+        # Run all test modules across CPU cores
+        success = run_all_tests_parallel()
+    elif len(sys.argv) > 1:
         # Run specific test module
         test_module = sys.argv[1]
         success = run_specific_test(test_module)
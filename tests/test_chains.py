@@ -1,54 +1,139 @@
 import unittest
 import sys
 import os
+import copy
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 # Add the parent directory to the Python path so we can import core modules
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from core.needs.maslow_needs import MaslowNeedsSystem, BasicNeeds
+from core.needs.maslow_needs import (
+    MaslowNeedsSystem, BasicNeeds, create_basic_needs_chain, create_basic_needs_chain_batch
+)
 from core.person.person import Person
-from core.environment.world_state import WorldState
-from core.cognition.meta_cognition import MetaCognitiveSystem
-from langchain_ollama import ChatOllama
+from core.environment.world_state import WorldState, create_world_description_system
+from core.cognition.meta_cognition import MetaCognitiveSystem, HISTORY_LIMIT
+from core.cognition.action_decision_chain import create_action_decision_chain
+from core.cognition.enhanced_action_decision_chain import create_meta_cognitive_action_chain
+from core.cognition.asimov_check_chain import create_asimov_check_system
+from core.cognition.state_analysis_chain import create_state_analysis_system
+from core.cognition.post_action_chain import create_post_action_system
+from core.needs.maslow_decision_chain import create_maslow_decision_chain
+
+# Canned payloads, serialized once at import instead of in every test
+_LLM_RESPONSE_JSON = json.dumps({"response": "test response"})
+
+_WORLD_DESC_COZY = json.dumps({
+    "list_of_descriptions": ["A cozy room with warm lighting"],
+    "list_of_actions": ["eat", "sleep", "read"]
+})
+
+_WORLD_DESC_PEACEFUL = json.dumps({
+    "list_of_descriptions": ["A peaceful environment"],
+    "list_of_actions": ["meditate", "exercise", "work"]
+})
+
+# Passed to the action chain already parsed, so no JSON round-trip
+_WORLD_DESC_LARGE = {
+    "list_of_descriptions": ["A very detailed description " * 100],
+    "list_of_actions": ["action1", "action2", "action3"] * 50
+}
+
+
+class _StubLLM:
+    """Minimal LLM without reference cycles, so it is freed as soon as it is dropped"""
+
+    def __init__(self, content):
+        self.content = content
+
+    def invoke(self, prompt):
+        return SimpleNamespace(content=self.content)
 
 
 class TestChains(unittest.TestCase):
     """Test cases for all chain functions in the Jenbina system"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by every test in the class"""
+        # Prototype person with needs, copied for each test so mutations never leak
+        cls._person_prototype = Person()
+        cls._person_prototype.update_all_needs()
+        
+        # The basic needs chain only reads its needs, so one instance serves every test
+        cls._basic_needs_template = BasicNeeds()
+    
     def setUp(self):
         """Set up test fixtures"""
-        # Mock LLM for testing
-        self.mock_llm = Mock()
-        self.mock_llm.invoke.return_value.content = '{"response": "test response"}'
-        
-        # Create test person with needs
-        self.person = Person()
-        self.person.update_all_needs()
+        self.person = copy.deepcopy(self._person_prototype)
         
         # Create test world state
         self.world = WorldState()
         
+        # Mock LLM for testing; a new one per test also starts with no cached needs answers
+        self.mock_llm = Mock()
+        self.mock_llm.invoke.return_value.content = _LLM_RESPONSE_JSON
+        
         # Create meta-cognitive system
         self.meta_cognitive_system = MetaCognitiveSystem(self.mock_llm)
 
     def test_create_basic_needs_chain(self):
         """Test the basic needs chain creation and execution"""
-        from core.needs.maslow_needs import create_basic_needs_chain
-        
         # Test with BasicNeeds object
-        basic_needs = BasicNeeds()
+        basic_needs = self._basic_needs_template
         result = create_basic_needs_chain(self.mock_llm, basic_needs)
         
         # Verify the function was called
         self.mock_llm.invoke.assert_called()
         self.assertIsInstance(result, str)
 
+    def test_basic_needs_chain_reuses_identical_prompts(self):
+        """Test that unchanged needs are answered from the response cache"""
+        first = create_basic_needs_chain(self.mock_llm, self.person.maslow_needs)
+        second = create_basic_needs_chain(self.mock_llm, self.person.maslow_needs)
+        self.assertEqual(first, second)
+        self.assertEqual(self.mock_llm.invoke.call_count, 1)
+
+        # A need change renders a different prompt and asks the LLM again
+        self.person.maslow_needs.needs['hunger'].satisfaction = 10.0
+        create_basic_needs_chain(self.mock_llm, self.person.maslow_needs)
+        self.assertEqual(self.mock_llm.invoke.call_count, 2)
+
+    def test_response_cache_is_per_llm(self):
+        """Test that a different LLM never receives another LLM's cached answers"""
+        create_basic_needs_chain(self.mock_llm, self.person.maslow_needs)
+
+        # Each stub is freed right after its call, so the next one usually gets
+        # the same id; it must still be asked instead of getting the old answer
+        for content in ('{"action": "eat"}', '{"action": "sleep"}', '{"action": "rest"}'):
+            self.assertEqual(create_basic_needs_chain(_StubLLM(content), self.person.maslow_needs), content)
+
+    def test_basic_needs_chain_batch(self):
+        """Test that several needs states share one batched LLM call"""
+        hungry = MaslowNeedsSystem()
+        hungry.needs['hunger'].satisfaction = 5.0
+        self.mock_llm.batch.return_value = [Mock(content='{"action": "rest"}'), Mock(content='{"action": "eat"}')]
+
+        # The repeated state is only sent once
+        results = create_basic_needs_chain_batch(
+            self.mock_llm, [self.person.maslow_needs, hungry, self.person.maslow_needs]
+        )
+
+        self.mock_llm.batch.assert_called_once()
+        self.assertEqual(len(self.mock_llm.batch.call_args[0][0]), 2)
+        self.mock_llm.invoke.assert_not_called()
+        self.assertEqual(results, ['{"action": "rest"}', '{"action": "eat"}', '{"action": "rest"}'])
+
+        # Batched answers are cached for later single calls
+        self.assertEqual(create_basic_needs_chain(self.mock_llm, hungry), '{"action": "eat"}')
+        self.mock_llm.invoke.assert_not_called()
+
     def test_create_world_description_system(self):
         """Test the world description system chain"""
-        from core.environment.world_state import create_world_description_system
-        
         # Create the chain
         world_chain = create_world_description_system(self.mock_llm)
         
@@ -59,42 +144,70 @@ class TestChains(unittest.TestCase):
         self.mock_llm.invoke.assert_called()
         self.assertIsInstance(result, str)
 
-    def test_create_action_decision_chain(self):
-        """Test the action decision chain"""
-        from core.cognition.action_decision_chain import create_action_decision_chain
+    def test_world_description_streaming(self):
+        """Test that the world description can be streamed chunk by chunk"""
+        self.mock_llm.stream.return_value = iter([Mock(content='{"list_of_'), Mock(content='actions": []}')])
+        world_chain = create_world_description_system(self.mock_llm)
         
-        # Mock world description
-        world_description = json.dumps({
-            "list_of_descriptions": ["A cozy room with warm lighting"],
-            "list_of_actions": ["eat", "sleep", "read"]
-        })
+        chunks = list(world_chain(self.person, self.world, stream=True))
         
+        self.mock_llm.stream.assert_called_once()
+        self.mock_llm.invoke.assert_not_called()
+        self.assertEqual("".join(chunks), '{"list_of_actions": []}')
+
+    def test_world_description_stream_stops_at_closing_brace(self):
+        """Test that streaming stops once the JSON object is complete"""
+        stream = iter([
+            Mock(content='{"list_of_descriptions": ["a \\"quoted\\" }"], '),
+            Mock(content='"list_of_actions": ["eat"]}\n\n  '),
+            Mock(content='   ')
+        ])
+        self.mock_llm.stream.return_value = stream
+        world_chain = create_world_description_system(self.mock_llm)
+
+        description = "".join(world_chain(self.person, self.world, stream=True))
+
+        self.assertEqual(json.loads(description)["list_of_actions"], ["eat"])
+        self.assertFalse(description.endswith(" "))
+        # The trailing padding chunk was never pulled from the LLM stream
+        self.assertEqual(next(stream).content, '   ')
+
+    def test_create_action_decision_chain(self):
+        """Test the action decision chain"""
         # Create the chain
         action_chain = create_action_decision_chain(self.mock_llm)
         
         # Test execution
-        result = action_chain(self.person, world_description, self.mock_llm)
+        result = action_chain(self.person, _WORLD_DESC_COZY, self.mock_llm)
         
         # Verify the function was called
         self.mock_llm.invoke.assert_called()
         self.assertIsInstance(result, dict)
         self.assertIn('chosen_action', result)
 
+    def test_action_decision_streaming_stops_at_closing_brace(self):
+        """Test that a streamed decision is parsed as soon as its JSON object closes"""
+        stream = iter([
+            Mock(content='{"chosen_action": "eat", '),
+            Mock(content='"reasoning": "hungry"}\n  '),
+            Mock(content='   ')
+        ])
+        self.mock_llm.stream.return_value = stream
+        action_chain = create_action_decision_chain(self.mock_llm, stream=True)
+
+        result = action_chain(self.person, _WORLD_DESC_COZY, self.mock_llm)
+
+        self.mock_llm.invoke.assert_not_called()
+        self.assertEqual(result, {"chosen_action": "eat", "reasoning": "hungry"})
+        self.assertEqual(next(stream).content, '   ')
+
     def test_create_meta_cognitive_action_chain(self):
         """Test the enhanced meta-cognitive action chain"""
-        from core.cognition.enhanced_action_decision_chain import create_meta_cognitive_action_chain
-        
-        # Mock world description
-        world_description = json.dumps({
-            "list_of_descriptions": ["A peaceful environment"],
-            "list_of_actions": ["meditate", "exercise", "work"]
-        })
-        
         # Test execution
         result = create_meta_cognitive_action_chain(
             self.mock_llm, 
             self.person, 
-            world_description, 
+            _WORLD_DESC_PEACEFUL, 
             self.meta_cognitive_system
         )
         
@@ -105,8 +218,6 @@ class TestChains(unittest.TestCase):
 
     def test_create_asimov_check_system(self):
         """Test the Asimov compliance check system"""
-        from core.cognition.asimov_check_chain import create_asimov_check_system
-        
         # Create the chain
         asimov_chain = create_asimov_check_system(self.mock_llm)
         
@@ -119,10 +230,24 @@ class TestChains(unittest.TestCase):
         self.assertIsInstance(result, dict)
         self.assertIn('compliant', result)
 
+    def test_asimov_check_with_draft_llm(self):
+        """Test that a confident draft verdict skips the main model and a doubtful one escalates"""
+        draft_llm = Mock()
+        draft_llm.invoke.return_value.content = '{"compliant": true, "confidence": 0.95, "explanation": "Safe"}'
+        asimov_chain = create_asimov_check_system(self.mock_llm, draft_llm=draft_llm)
+        
+        result = asimov_chain("Read a book")
+        self.assertTrue(result['compliant'])
+        self.mock_llm.invoke.assert_not_called()
+        
+        draft_llm.invoke.return_value.content = '{"compliant": true, "confidence": 0.4, "explanation": "Unsure"}'
+        self.mock_llm.invoke.return_value.content = '{"compliant": false, "explanation": "Risky"}'
+        result = asimov_chain("Climb the roof")
+        self.assertFalse(result['compliant'])
+        self.mock_llm.invoke.assert_called_once()
+
     def test_create_state_analysis_system(self):
         """Test the state analysis system"""
-        from core.cognition.state_analysis_chain import create_state_analysis_system
-        
         # Test execution
         action_decision = "Eat a healthy meal"
         compliance_check = {"compliant": True, "explanation": "Safe action"}
@@ -137,10 +262,32 @@ class TestChains(unittest.TestCase):
         self.mock_llm.invoke.assert_called()
         self.assertIsInstance(result, str)
 
+    def test_create_post_action_system(self):
+        """Test the combined Asimov check and state analysis system"""
+        self.mock_llm.invoke.return_value.content = json.dumps({
+            "asimov_compliance": {"compliant": True, "explanation": "Safe action"},
+            "state_analysis": {"hunger_level": 20}
+        })
+
+        post_action_chain = create_post_action_system(self.mock_llm)
+        result = post_action_chain("Eat a healthy meal")
+
+        # Both results come back from a single LLM call
+        self.assertEqual(self.mock_llm.invoke.call_count, 1)
+        self.assertTrue(result['asimov_compliance']['compliant'])
+        self.assertEqual(result['state_analysis'], {"hunger_level": 20})
+
+        # Non-compliant actions get no state analysis
+        self.mock_llm.invoke.return_value.content = json.dumps({
+            "asimov_compliance": {"compliant": False, "explanation": "Harmful"},
+            "state_analysis": {"hunger_level": 0}
+        })
+        result = post_action_chain("Push someone")
+        self.assertFalse(result['asimov_compliance']['compliant'])
+        self.assertIsNone(result['state_analysis'])
+
     def test_maslow_decision_chain(self):
         """Test the Maslow decision chain"""
-        from core.needs.maslow_decision_chain import create_maslow_decision_chain
-        
         # Create the chain
         maslow_chain = create_maslow_decision_chain(self.mock_llm)
         
@@ -157,13 +304,13 @@ class TestChains(unittest.TestCase):
 
     def test_chain_integration(self):
         """Test integration between multiple chains"""
-        from core.environment.world_state import create_world_description_system
-        from core.cognition.action_decision_chain import create_action_decision_chain
-        from core.cognition.asimov_check_chain import create_asimov_check_system
-        
-        # Step 1: Generate world description
+        # Step 1: Needs analysis and world description don't depend on each other,
+        # so they run concurrently the way the simulation loop runs them
         world_chain = create_world_description_system(self.mock_llm)
-        world_description = world_chain(self.person, self.world)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            needs_future = executor.submit(create_basic_needs_chain, self.mock_llm, self.person.maslow_needs)
+            world_description = world_chain(self.person, self.world)
+            needs_analysis = needs_future.result()
         
         # Step 2: Make action decision
         action_chain = create_action_decision_chain(self.mock_llm)
@@ -174,57 +321,63 @@ class TestChains(unittest.TestCase):
         compliance = asimov_chain(action_decision.get('chosen_action', ''))
         
         # Verify all chains executed
+        self.assertIsInstance(needs_analysis, str)
         self.assertIsInstance(world_description, str)
         self.assertIsInstance(action_decision, dict)
         self.assertIsInstance(compliance, dict)
 
     def test_error_handling(self):
         """Test error handling in chains"""
-        from core.needs.maslow_needs import create_basic_needs_chain
-        
         # Test with invalid LLM
         with self.assertRaises(Exception):
-            create_basic_needs_chain(None, BasicNeeds())
+            create_basic_needs_chain(None, self._basic_needs_template)
 
+    @unittest.skipUnless(os.environ.get("JENBINA_REAL_LLM") == "1", "real LLM disabled (set JENBINA_REAL_LLM=1)")
     def test_chain_with_real_llm(self):
         """Test chains with a real LLM (if available)"""
         try:
-            # Try to create a real LLM
+            # Try to create a real LLM; only this test needs the Ollama client
+            from langchain_ollama import ChatOllama
             real_llm = ChatOllama(model='llama3.2:3b-instruct-fp16', temperature=0)
             
-            from core.needs.maslow_needs import create_basic_needs_chain
-            
             # Test with real LLM
-            basic_needs = BasicNeeds()
+            basic_needs = self._basic_needs_template
             result = create_basic_needs_chain(real_llm, basic_needs)
             
             self.assertIsInstance(result, str)
             self.assertGreater(len(result), 0)
             
+            # Empty, default and extreme needs fan out as concurrent requests in one batch
+            empty_needs, extreme_needs = MaslowNeedsSystem(), MaslowNeedsSystem()
+            for name in empty_needs.needs:
+                empty_needs.needs[name].satisfaction = 0.0
+                extreme_needs.needs[name].satisfaction = 100.0
+            results = create_basic_needs_chain_batch(real_llm, [empty_needs, basic_needs, extreme_needs])
+            self.assertEqual(len(results), 3)
+            for result in results:
+                self.assertGreater(len(result), 0)
+            
         except Exception as e:
             # Skip if real LLM is not available
             self.skipTest(f"Real LLM not available: {e}")
 
     def test_chain_performance(self):
         """Test chain performance and response times"""
-        import time
+        # A plain callable keeps Mock's call recording out of the timed region
+        response = SimpleNamespace(content=_LLM_RESPONSE_JSON)
+        fast_llm = SimpleNamespace(invoke=lambda *args, **kwargs: response)
         
-        from core.needs.maslow_needs import create_basic_needs_chain
-        
-        start_time = time.time()
-        basic_needs = BasicNeeds()
-        result = create_basic_needs_chain(self.mock_llm, basic_needs)
-        end_time = time.time()
+        start_ns = time.perf_counter_ns()
+        basic_needs = self._basic_needs_template
+        result = create_basic_needs_chain(fast_llm, basic_needs)
+        response_ns = time.perf_counter_ns() - start_ns
         
         # Verify reasonable response time (should be fast with mock)
-        response_time = end_time - start_time
-        self.assertLess(response_time, 1.0)  # Should be under 1 second with mock
+        self.assertLess(response_ns, 100_000_000)  # Should be under 100ms with mock and prebuilt prompts
         self.assertIsInstance(result, str)
 
     def test_chain_data_validation(self):
         """Test data validation in chains"""
-        from core.cognition.action_decision_chain import create_action_decision_chain
-        
         # Test with invalid world description
         invalid_world_description = "invalid json"
         
@@ -238,30 +391,29 @@ class TestChains(unittest.TestCase):
 class TestChainEdgeCases(unittest.TestCase):
     """Test edge cases and boundary conditions for chains"""
     
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by every test in the class"""
+        cls._person_prototype = Person()
+    
     def setUp(self):
         """Set up test fixtures"""
-        self.mock_llm = Mock()
-        self.mock_llm.invoke.return_value.content = '{"response": "test response"}'
-        self.person = Person()
+        self.person = copy.deepcopy(self._person_prototype)
         self.world = WorldState()
+        self.mock_llm = Mock()
+        self.mock_llm.invoke.return_value.content = _LLM_RESPONSE_JSON
 
     def test_empty_needs(self):
         """Test chains with empty or minimal needs"""
-        from core.needs.maslow_needs import create_basic_needs_chain
-        
-        # Create person with minimal needs
-        person = Person()
         # Reset needs to minimum
-        for need in person.maslow_needs.needs.values():
+        for need in self.person.maslow_needs.needs.values():
             need.satisfaction = 0.0
         
-        result = create_basic_needs_chain(self.mock_llm, person.maslow_needs)
+        result = create_basic_needs_chain(self.mock_llm, self.person.maslow_needs)
         self.assertIsInstance(result, str)
 
     def test_extreme_needs(self):
         """Test chains with extreme need values"""
-        from core.needs.maslow_needs import create_basic_needs_chain
-        
         # Set needs to extreme values
         for need in self.person.maslow_needs.needs.values():
             need.satisfaction = 100.0  # Maximum satisfaction
@@ -271,19 +423,23 @@ class TestChainEdgeCases(unittest.TestCase):
 
     def test_large_world_description(self):
         """Test chains with very large world descriptions"""
-        from core.cognition.action_decision_chain import create_action_decision_chain
-        
-        # Create large world description
-        large_description = json.dumps({
-            "list_of_descriptions": ["A very detailed description " * 100],
-            "list_of_actions": ["action1", "action2", "action3"] * 50
-        })
-        
         action_chain = create_action_decision_chain(self.mock_llm)
-        result = action_chain(self.person, large_description, self.mock_llm)
+        result = action_chain(self.person, _WORLD_DESC_LARGE, self.mock_llm)
         
         self.assertIsInstance(result, dict)
 
+    def test_meta_cognitive_history_is_bounded(self):
+        """Test that old cognitive processes are dropped but still counted"""
+        meta_cognitive_system = MetaCognitiveSystem(self.mock_llm)
+        for i in range(HISTORY_LIMIT + 5):
+            meta_cognitive_system.monitor_cognitive_process(
+                "decision", {"step": i}, {}, [], 0.5
+            )
+
+        self.assertEqual(len(meta_cognitive_system.cognitive_history), HISTORY_LIMIT)
+        self.assertEqual(meta_cognitive_system.cognitive_history[-1].input_data, {"step": HISTORY_LIMIT + 4})
+        self.assertEqual(meta_cognitive_system.get_meta_cognitive_stats()["total_processes"], HISTORY_LIMIT + 5)
+
 
 if __name__ == '__main__':
     # Run the tests
@@ -10,7 +10,6 @@ import os
 import tempfile
 import shutil
 from datetime import datetime, timedelta
-import json
 
 # Add the core directory to the path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'core'))
@@ -141,6 +140,33 @@ class TestHybridMemorySystem(unittest.TestCase):
         self.assertIsNotNone(event_id)
         self.assertNotEqual(event_id, "test_event_001")  # Should be different
     
+    def test_store_memories_batch(self):
+        """Test storing several memory events at once"""
+        events = [
+            MemoryEvent(
+                event_id=f"batch_event_{i}",
+                timestamp=datetime.now(),
+                event_type="action",
+                content=f"Batch action {i}",
+                people=["Carol"],
+                locations=["Park"],
+                actions=["walked"],
+                emotions=["calm"],
+                needs_state={"rest": 60.0},
+                metadata={}
+            )
+            for i in range(3)
+        ]
+        
+        event_ids = self.memory_system.store_memories_batch(events)
+        
+        self.assertEqual(event_ids, ["batch_event_0", "batch_event_1", "batch_event_2"])
+        memories = self.memory_system.get_temporal_memories(
+            start_time=datetime.now() - timedelta(hours=1),
+            end_time=datetime.now() + timedelta(hours=1)
+        )
+        self.assertEqual(len(memories), 3)
+    
     def test_retrieve_semantic_memories(self):
         """Test semantic memory retrieval"""
         # Store some test memories
@@ -160,8 +186,7 @@ class TestHybridMemorySystem(unittest.TestCase):
             for i in range(3)
         ]
         
-        for event in events:
-            self.memory_system.store_memory(event)
+        self.memory_system.store_memories_batch(events)
         
         # Retrieve memories
         memories = self.memory_system.retrieve_semantic_memories("artificial intelligence", top_k=3)
@@ -194,8 +219,7 @@ class TestHybridMemorySystem(unittest.TestCase):
             for i in range(5)
         ]
         
-        for event in events:
-            self.memory_system.store_memory(event)
+        self.memory_system.store_memories_batch(events)
         
         # Get memories from last 3 hours
         memories = self.memory_system.get_temporal_memories(
@@ -243,8 +267,7 @@ class TestHybridMemorySystem(unittest.TestCase):
             for i in range(3)
         ])
         
-        for event in events:
-            self.memory_system.store_memory(event)
+        self.memory_system.store_memories_batch(events)
         
         # Get only conversation events
         conversations = self.memory_system.get_temporal_memories(
@@ -278,8 +301,7 @@ class TestHybridMemorySystem(unittest.TestCase):
             for i in range(5)
         ]
         
-        for event in events:
-            self.memory_system.store_memory(event)
+        self.memory_system.store_memories_batch(events)
         
         # Get hunger history
         hunger_history = self.memory_system.get_needs_history(
@@ -319,8 +341,7 @@ class TestHybridMemorySystem(unittest.TestCase):
             for i in range(3)
         ]
         
-        for event in events:
-            self.memory_system.store_memory(event)
+        self.memory_system.store_memories_batch(events)
         
         # Get all needs history
         all_history = self.memory_system.get_needs_history(
@@ -355,8 +376,7 @@ class TestHybridMemorySystem(unittest.TestCase):
             for i in range(5)
         ]
         
-        for event in events:
-            self.memory_system.store_memory(event)
+        self.memory_system.store_memories_batch(events)
         
         # Get statistics
         stats = self.memory_system.get_memory_stats()
@@ -394,8 +414,7 @@ class TestHybridMemorySystem(unittest.TestCase):
             for i in range(3)
         ]
         
-        for event in events:
-            self.memory_system.store_memory(event)
+        self.memory_system.store_memories_batch(events)
         
         # Try to get person relationships (should return empty dict without Neo4j)
         relationships = self.memory_system.get_person_relationships("Alice")
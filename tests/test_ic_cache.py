@@ -0,0 +1,77 @@
+import unittest
+import sys
+import os
+
+# Add the parent directory to the Python path so we can import core modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.person.person import Person
+from core.environment.world_state import WorldState
+from core.cognition.ic_cache import SemanticDecisionCache
+
+
+class TestSemanticDecisionCache(unittest.TestCase):
+    """Test cases for the action decision cache"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.cache = SemanticDecisionCache(bucket_size=10.0, max_entries=2)
+        self.person = Person()
+        self.world = WorldState()
+
+    def test_near_duplicate_states_share_a_decision(self):
+        """Test that small need changes within a bucket hit the cache"""
+        self.person.maslow_needs.needs['hunger'].satisfaction = 41.0
+        key = self.cache.make_key(self.person, self.world)
+        self.assertIsNone(self.cache.get(key))
+        self.cache.put(key, {"chosen_action": "eat"})
+
+        self.person.maslow_needs.needs['hunger'].satisfaction = 48.0
+        cached = self.cache.get(self.cache.make_key(self.person, self.world))
+        self.assertEqual(cached, {"chosen_action": "eat"})
+
+        self.person.maslow_needs.needs['hunger'].satisfaction = 52.0
+        self.assertIsNone(self.cache.get(self.cache.make_key(self.person, self.world)))
+
+        stats = self.cache.get_stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 2)
+
+    def test_cached_decision_is_a_copy(self):
+        """Test that callers can't mutate the stored decision"""
+        key = self.cache.make_key(self.person)
+        self.cache.put(key, {"chosen_action": "eat"})
+        self.cache.get(key)["chosen_action"] = "sleep"
+        self.assertEqual(self.cache.get(key)["chosen_action"], "eat")
+
+    def test_decision_is_reused_with_its_world_description(self):
+        """Test that a hit returns the world description the decision was made from"""
+        key = self.cache.make_key(self.person, self.world)
+        description = '{"list_of_descriptions": ["A kitchen"], "list_of_actions": ["eat", "sleep"]}'
+        self.assertTrue(self.cache.put(key, {"chosen_action": "eat"}, description))
+
+        self.assertIn(key, self.cache)
+        self.assertEqual(self.cache.lookup(key), ({"chosen_action": "eat"}, description))
+
+    def test_unavailable_action_is_not_cached(self):
+        """Test that decisions outside their description's actions are never stored"""
+        key = self.cache.make_key(self.person, self.world)
+        description = {"list_of_descriptions": ["A kitchen"], "list_of_actions": ["eat", "sleep"]}
+        self.assertFalse(self.cache.put(key, {"chosen_action": "fly"}, description))
+        self.assertFalse(self.cache.put(key, {"chosen_action": "eat"}, "not json"))
+        self.assertNotIn(key, self.cache)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that the cache stays within max_entries"""
+        self.cache.put(("a",), {"chosen_action": "eat"})
+        self.cache.put(("b",), {"chosen_action": "sleep"})
+        self.cache.get(("a",))
+        self.cache.put(("c",), {"chosen_action": "rest"})
+
+        self.assertIsNotNone(self.cache.get(("a",)))
+        self.assertIsNone(self.cache.get(("b",)))
+        self.assertEqual(self.cache.get_stats()['entries'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,7 +15,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'core'))
 
 from core.needs.maslow_needs import (
     MaslowNeedsSystem, MaslowNeed, NeedLevel, NeedCategory,
-    BasicNeeds, Need, create_basic_needs_chain
+    BasicNeeds, Need, create_basic_needs_chain, render_basic_needs_prompt
 )
 
 
@@ -206,7 +206,38 @@ class TestMaslowNeedsSystem(unittest.TestCase):
         low_needs = self.needs_system.get_low_needs()
         self.assertIn('hunger', low_needs)
         self.assertIn('confidence', low_needs)
-    
+
+    def test_cached_aggregates_follow_need_changes(self):
+        """Test that cached aggregates are refreshed when a need changes"""
+        initial_overall = self.needs_system.get_overall_satisfaction()
+        self.assertNotIn('hunger', self.needs_system.get_critical_needs())
+
+        self.needs_system.needs['hunger'].satisfaction = 10.0
+
+        self.assertLess(self.needs_system.get_overall_satisfaction(), initial_overall)
+        self.assertIn('hunger', self.needs_system.get_critical_needs())
+
+        self.needs_system.remove_need('hunger')
+        self.assertNotIn('hunger', self.needs_system.get_critical_needs())
+
+    def test_snapshot(self):
+        """Test that a snapshot matches the live getters and doesn't follow later changes"""
+        self.needs_system.needs['hunger'].satisfaction = 10.0
+        snap = self.needs_system.snapshot()
+
+        self.assertEqual(snap.overall_satisfaction, self.needs_system.get_overall_satisfaction())
+        self.assertEqual(snap.critical_needs, self.needs_system.get_critical_needs())
+        self.assertEqual(snap.low_needs, self.needs_system.get_low_needs())
+        self.assertEqual(snap.get_need_satisfaction('hunger'), 10.0)
+        self.assertEqual(snap.get_need_satisfaction('nonexistent'), 0.0)
+
+        self.needs_system.needs['hunger'].satisfaction = 90.0
+        self.assertEqual(snap.get_need_satisfaction('hunger'), 10.0)
+        self.assertIn('hunger', snap.critical_needs)
+        # The live getters moved on while the snapshot kept its values
+        self.assertNotIn('hunger', self.needs_system.get_critical_needs())
+        self.assertGreater(self.needs_system.get_overall_satisfaction(), snap.overall_satisfaction)
+
     def test_get_priority_needs(self):
         """Test getting priority needs"""
         priority_needs = self.needs_system.get_priority_needs(5)
@@ -216,7 +247,30 @@ class TestMaslowNeedsSystem(unittest.TestCase):
             self.assertIn('name', need)
             self.assertIn('satisfaction', need)
             self.assertIn('priority_score', need)
-    
+
+    def test_cached_priority_needs_and_insights_follow_need_changes(self):
+        """Test that cached priorities and insights are copies refreshed on need changes"""
+        priority_needs = self.needs_system.get_priority_needs(3)
+        priority_needs[0]['name'] = 'mutated'
+        insights = self.needs_system.get_growth_insights()
+        insights['next_priorities'].clear()
+        self.assertNotEqual(self.needs_system.get_priority_needs(3)[0]['name'], 'mutated')
+        self.assertEqual(len(self.needs_system.get_growth_insights()['next_priorities']), 3)
+
+        # Put hunger at the top of the cached priorities, then satisfy it
+        self.needs_system.needs['hunger'].satisfaction = 0.0
+        before = [need['name'] for need in self.needs_system.get_growth_insights()['next_priorities']]
+        self.assertEqual(before[0], 'hunger')
+
+        self.needs_system.needs['creativity'].satisfaction = 0.0
+        self.needs_system.needs['hunger'].satisfaction = 100.0
+        names = [need['name'] for need in self.needs_system.get_priority_needs(30)]
+        expected = sorted(self.needs_system.needs.values(), key=lambda need: need.get_priority_score(), reverse=True)
+        self.assertEqual(names, [need.name for need in expected])
+        after = [need['name'] for need in self.needs_system.get_growth_insights()['next_priorities']]
+        self.assertNotIn('hunger', after)
+        self.assertNotEqual(after, before)
+
     def test_growth_stage_progression(self):
         """Test automatic growth stage progression"""
         # Start at survival mode
@@ -252,7 +306,52 @@ class TestMaslowNeedsSystem(unittest.TestCase):
         self.assertIn('low_needs_count', summary)
         self.assertIn('level_summaries', summary)
         self.assertIn('priority_needs', summary)
-    
+
+    def test_needs_summary_counts_at_scale(self):
+        """Test summary counts against a direct recount over many needs"""
+        levels = list(NeedLevel)
+        for i in range(500):
+            self.needs_system.add_need(f'need_{i}', NeedCategory.FOOD, levels[i % len(levels)],
+                                       initial_satisfaction=float(i % 101))
+
+        summary = self.needs_system.get_needs_summary()
+        all_needs = list(self.needs_system.needs.values())
+        self.assertEqual(summary['critical_needs_count'], sum(need.is_critical() for need in all_needs))
+        self.assertEqual(summary['low_needs_count'], sum(need.is_low() for need in all_needs))
+        for level in levels:
+            level_needs = [need for need in all_needs if need.level == level]
+            level_summary = summary['level_summaries'][level.name]
+            self.assertEqual(level_summary['need_count'], len(level_needs))
+            self.assertEqual(level_summary['critical_count'], sum(need.is_critical() for need in level_needs))
+            self.assertEqual(level_summary['low_count'], sum(need.is_low() for need in level_needs))
+
+        # Callers get copies of the cached summary
+        summary['level_summaries'][levels[0].name]['need_count'] = -1
+        self.assertGreater(self.needs_system.get_needs_summary()['level_summaries'][levels[0].name]['need_count'], 0)
+
+    def test_level_stats(self):
+        """Test per-level stats cover every level and follow need changes"""
+        stats = self.needs_system.get_level_stats()
+        self.assertEqual(set(stats), set(NeedLevel))
+        physiological = stats[NeedLevel.PHYSIOLOGICAL]
+        self.assertEqual(physiological['critical_count'], 0)
+
+        self.needs_system.satisfy_need('hunger', -95.0)
+        physiological = self.needs_system.get_level_stats()[NeedLevel.PHYSIOLOGICAL]
+        self.assertEqual(physiological['critical_count'], 1)
+        self.assertEqual(physiological['low_count'], 1)
+
+    def test_decision_prompt_fields_follow_need_changes(self):
+        """Test that cached decision prompt fields leave the time out and follow need changes"""
+        fields = self.needs_system.get_decision_prompt_fields()
+        self.assertNotIn('current_time', fields)
+        self.assertEqual(self.needs_system.get_decision_prompt_fields(), fields)
+
+        self.needs_system.satisfy_need('hunger', -95.0)
+        changed = self.needs_system.get_decision_prompt_fields()
+        self.assertIn('hunger', changed['priority_needs'])
+        self.assertNotEqual(changed, fields)
+
     def test_add_need(self):
         """Test adding a new need"""
         initial_count = len(self.needs_system.needs)
@@ -320,6 +419,12 @@ class TestBasicNeedsBackwardCompatibility(unittest.TestCase):
         self.assertIn('hunger', self.basic_needs.legacy_mapping)
         self.assertIn('sleep', self.basic_needs.legacy_mapping)
         self.assertIn('safety', self.basic_needs.legacy_mapping)
+
+    def test_basic_needs_is_slotted(self):
+        """Test that BasicNeeds carries no per-instance __dict__"""
+        self.assertFalse(hasattr(self.basic_needs, '__dict__'))
+        with self.assertRaises(AttributeError):
+            self.basic_needs.unexpected_attribute = 1.0
     
     def test_basic_needs_property(self):
         """Test the needs property mapping"""
@@ -374,6 +479,16 @@ class TestBasicNeedsBackwardCompatibility(unittest.TestCase):
         self.assertEqual(len(self.basic_needs.needs), initial_count)
         self.assertNotIn('test_need', self.basic_needs.needs)
 
+    def test_rendered_prompt_is_reused_until_needs_change(self):
+        """Test that unchanged needs reuse the rendered decision prompt"""
+        needs_system = self.basic_needs.maslow_system
+        prompt = render_basic_needs_prompt(needs_system)
+        self.assertIs(render_basic_needs_prompt(needs_system), prompt)
+
+        needs_system.needs['hunger'].satisfaction = 42.0
+        self.assertNotEqual(render_basic_needs_prompt(needs_system), prompt)
+        self.assertIn('hunger: 42.0%', render_basic_needs_prompt(needs_system))
+
 
 class TestLegacyNeed(unittest.TestCase):
     """Test the legacy Need class"""
@@ -396,6 +511,11 @@ class TestLegacyNeed(unittest.TestCase):
         self.assertLess(self.need.satisfaction, initial_satisfaction)
         self.assertGreaterEqual(self.need.satisfaction, 0)
     
+    @unittest.skipIf(sys.version_info < (3, 10), "slotted dataclasses need Python 3.10")
+    def test_need_is_slotted(self):
+        """Test that legacy Need objects carry no per-instance __dict__"""
+        self.assertFalse(hasattr(self.need, '__dict__'))
+    
     def test_need_satisfy(self):
         """Test legacy Need satisfy"""
         initial_satisfaction = self.need.satisfaction